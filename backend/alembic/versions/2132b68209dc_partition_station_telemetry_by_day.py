@@ -0,0 +1,93 @@
+"""partition station telemetry by day
+
+Revision ID: 2132b68209dc
+Revises: d3cc8928dc40
+Create Date: 2026-10-18 10:02:17.530291
+
+"""
+from datetime import date, datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2132b68209dc'
+down_revision: Union[str, None] = 'd3cc8928dc40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Matches TELEMETRY_PARTITIONS_AHEAD; the maintenance job keeps it topped up
+PARTITIONS_AHEAD = 7
+
+
+def _partition(day: date) -> str:
+    upper = (day + timedelta(days=1)).isoformat()
+    return f"PARTITION p{day:%Y%m%d} VALUES LESS THAN (TO_DAYS('{upper}'))"
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    # 1. InnoDB does not support foreign keys on partitioned tables
+    fk_names = conn.execute(sa.text("""
+        SELECT CONSTRAINT_NAME
+        FROM information_schema.REFERENTIAL_CONSTRAINTS
+        WHERE CONSTRAINT_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'station_telemetry';
+    """)).scalars().all()
+
+    for name in fk_names:
+        conn.execute(sa.text(
+            f"ALTER TABLE station_telemetry DROP FOREIGN KEY `{name}`;"
+        ))
+
+    # 2. The partitioning column must be part of every unique key
+    conn.execute(sa.text("""
+        ALTER TABLE station_telemetry
+        DROP PRIMARY KEY,
+        ADD PRIMARY KEY (id, timestamp);
+    """))
+
+    # 3. One partition per day, from the oldest row to today + ahead
+    oldest = conn.execute(sa.text(
+        "SELECT DATE(MIN(timestamp)) FROM station_telemetry;"
+    )).scalar()
+
+    # UTC, like the maintenance job (telemetry_partitions.py)
+    today = datetime.utcnow().date()
+    day = min(oldest or today, today)
+    partitions = []
+    while day <= today + timedelta(days=PARTITIONS_AHEAD):
+        partitions.append(_partition(day))
+        day += timedelta(days=1)
+
+    partitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+
+    conn.execute(sa.text(
+        "ALTER TABLE station_telemetry "
+        "PARTITION BY RANGE (TO_DAYS(timestamp)) ("
+        + ", ".join(partitions)
+        + ");"
+    ))
+
+
+def downgrade():
+    conn = op.get_bind()
+
+    conn.execute(sa.text("""
+        ALTER TABLE station_telemetry REMOVE PARTITIONING;
+    """))
+
+    conn.execute(sa.text("""
+        ALTER TABLE station_telemetry
+        DROP PRIMARY KEY,
+        ADD PRIMARY KEY (id);
+    """))
+
+    conn.execute(sa.text("""
+        ALTER TABLE station_telemetry
+        ADD CONSTRAINT station_telemetry_ibfk_1
+        FOREIGN KEY (station_id) REFERENCES stations (id) ON DELETE CASCADE;
+    """))
@@ -0,0 +1,32 @@
+"""add booking user start index
+
+Revision ID: 5b7e19c0d2a4
+Revises: e46a30d923cc
+Create Date: 2026-10-18 14:05:37.402911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e19c0d2a4'
+down_revision: Union[str, None] = 'e46a30d923cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # Serves "my bookings" keyset pages on (start_time, id) per user;
+    # InnoDB appends the primary key (id) to the index
+    op.create_index(
+        "idx_booking_user_start",
+        "bookings",
+        ["user_id", "start_time"],
+    )
+
+
+def downgrade():
+    op.drop_index("idx_booking_user_start", table_name="bookings")
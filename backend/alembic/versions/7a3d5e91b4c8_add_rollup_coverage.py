@@ -0,0 +1,30 @@
+"""add rollup coverage
+
+Revision ID: 7a3d5e91b4c8
+Revises: c2f85a3b6e19
+Create Date: 2026-10-18 17:02:19.551042
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3d5e91b4c8'
+down_revision: Union[str, None] = 'c2f85a3b6e19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # NULL until the rollup job next catches up: readers fall back to raw rows
+    op.add_column(
+        "telemetry_rollup_state",
+        sa.Column("covered_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("telemetry_rollup_state", "covered_until")
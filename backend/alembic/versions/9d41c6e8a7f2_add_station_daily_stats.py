@@ -0,0 +1,38 @@
+"""add station daily stats
+
+Revision ID: 9d41c6e8a7f2
+Revises: 5b7e19c0d2a4
+Create Date: 2026-10-18 14:48:12.630257
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d41c6e8a7f2'
+down_revision: Union[str, None] = '5b7e19c0d2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "station_daily_stats",
+        sa.Column("station_id", sa.BigInteger(), sa.ForeignKey("stations.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("completed_bookings", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cancelled_bookings", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("revenue", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.create_index("idx_daily_stats_day", "station_daily_stats", ["day"])
+
+    # Populate from existing bookings with:
+    #   python -m app.services.daily_stats
+
+
+def downgrade():
+    op.drop_index("idx_daily_stats_day", table_name="station_daily_stats")
+    op.drop_table("station_daily_stats")
@@ -0,0 +1,32 @@
+"""add booking revenue covering index
+
+Revision ID: c2f85a3b6e19
+Revises: 9d41c6e8a7f2
+Create Date: 2026-10-18 15:20:54.118736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f85a3b6e19'
+down_revision: Union[str, None] = '9d41c6e8a7f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # Covers the owner revenue summary: per station, status IN (...)
+    # and an end_time range, with total_cost read from the index
+    op.create_index(
+        "idx_booking_station_status_end",
+        "bookings",
+        ["station_id", "status", "end_time", "total_cost"],
+    )
+
+
+def downgrade():
+    op.drop_index("idx_booking_station_status_end", table_name="bookings")
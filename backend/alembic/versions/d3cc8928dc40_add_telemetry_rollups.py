@@ -0,0 +1,58 @@
+"""add telemetry rollups
+
+Revision ID: d3cc8928dc40
+Revises: 607530e6c831_add_spatial_index_stations
+Create Date: 2026-10-18 09:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3cc8928dc40'
+down_revision: Union[str, None] = '607530e6c831_add_spatial_index_stations'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rollup_columns():
+    return [
+        sa.Column("station_id", sa.BigInteger(), sa.ForeignKey("stations.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("sample_count", sa.Integer(), nullable=False),
+        sa.Column("voltage_min", sa.Float(), nullable=False),
+        sa.Column("voltage_max", sa.Float(), nullable=False),
+        sa.Column("voltage_avg", sa.Float(), nullable=False),
+        sa.Column("current_min", sa.Float(), nullable=False),
+        sa.Column("current_max", sa.Float(), nullable=False),
+        sa.Column("current_avg", sa.Float(), nullable=False),
+        sa.Column("temperature_min", sa.Float(), nullable=False),
+        sa.Column("temperature_max", sa.Float(), nullable=False),
+        sa.Column("temperature_avg", sa.Float(), nullable=False),
+        sa.Column("fault_count", sa.Integer(), nullable=False),
+    ]
+
+
+def upgrade():
+    op.create_table("station_telemetry_1m", *_rollup_columns())
+    op.create_index("idx_telemetry_1m_bucket", "station_telemetry_1m", ["bucket_start"])
+
+    op.create_table("station_telemetry_1h", *_rollup_columns())
+    op.create_index("idx_telemetry_1h_bucket", "station_telemetry_1h", ["bucket_start"])
+
+    op.create_table(
+        "telemetry_rollup_state",
+        sa.Column("name", sa.String(length=32), primary_key=True),
+        sa.Column("last_id", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade():
+    op.drop_table("telemetry_rollup_state")
+    op.drop_index("idx_telemetry_1h_bucket", table_name="station_telemetry_1h")
+    op.drop_table("station_telemetry_1h")
+    op.drop_index("idx_telemetry_1m_bucket", table_name="station_telemetry_1m")
+    op.drop_table("station_telemetry_1m")
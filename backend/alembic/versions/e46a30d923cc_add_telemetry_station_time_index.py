@@ -0,0 +1,32 @@
+"""add telemetry station time index
+
+Revision ID: e46a30d923cc
+Revises: 2132b68209dc
+Create Date: 2026-10-18 11:40:05.118364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e46a30d923cc'
+down_revision: Union[str, None] = '2132b68209dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # Serves (station_id, timestamp, id) keyset scans; InnoDB appends
+    # the primary key (id, timestamp) to every secondary index
+    op.create_index(
+        "idx_telemetry_station_time",
+        "station_telemetry",
+        ["station_id", "timestamp"],
+    )
+
+
+def downgrade():
+    op.drop_index("idx_telemetry_station_time", table_name="station_telemetry")
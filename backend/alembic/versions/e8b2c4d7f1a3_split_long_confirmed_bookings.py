@@ -0,0 +1,85 @@
+"""split long confirmed bookings
+
+Revision ID: e8b2c4d7f1a3
+Revises: 7a3d5e91b4c8
+Create Date: 2026-10-18 19:41:06.284517
+
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b2c4d7f1a3'
+down_revision: Union[str, None] = '7a3d5e91b4c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# BOOKING_MAX_HOURS when this migration was written. The conditional
+# booking insert only probes bookings starting within this many hours
+# before a new window, so no confirmed booking may be longer.
+MAX_HOURS = 24
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    long_bookings = conn.execute(sa.text("""
+        SELECT id, user_id, station_id, start_time, end_time, total_cost
+        FROM bookings
+        WHERE status = 'confirmed'
+          AND end_time > start_time + INTERVAL :hours HOUR
+        FOR UPDATE;
+    """), {"hours": MAX_HOURS}).all()
+
+    step = timedelta(hours=MAX_HOURS)
+
+    for booking_id, user_id, station_id, start, end, total_cost in long_bookings:
+        # Consecutive segments of at most MAX_HOURS, cost prorated by
+        # duration; the last segment takes the rounding remainder
+        bounds = []
+        segment_start = start
+        while segment_start < end:
+            bounds.append((segment_start, min(segment_start + step, end)))
+            segment_start += step
+
+        total_seconds = (end - start).total_seconds()
+        costs = [
+            round(total_cost * (stop - begin).total_seconds() / total_seconds, 2)
+            for begin, stop in bounds[:-1]
+        ]
+        costs.append(round(total_cost - sum(costs), 2))
+
+        # The original row (and id) keeps the first segment
+        first_end = bounds[0][1]
+        conn.execute(sa.text("""
+            UPDATE bookings
+            SET end_time = :end_time, total_cost = :total_cost,
+                version = version + 1
+            WHERE id = :id;
+        """), {"id": booking_id, "end_time": first_end, "total_cost": costs[0]})
+
+        for (begin, stop), cost in zip(bounds[1:], costs[1:]):
+            conn.execute(sa.text("""
+                INSERT INTO bookings
+                    (user_id, station_id, start_time, end_time,
+                     total_cost, status, version)
+                VALUES
+                    (:user_id, :station_id, :start_time, :end_time,
+                     :total_cost, 'confirmed', 1);
+            """), {
+                "user_id": user_id,
+                "station_id": station_id,
+                "start_time": begin,
+                "end_time": stop,
+                "total_cost": cost,
+            })
+
+
+def downgrade():
+    # Segments are indistinguishable from bookings made back to back;
+    # leaving them split is harmless for the older code path
+    pass
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Path, Body, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -8,7 +8,16 @@ from ....models.models import User
 from ....models.models import StationStatus, UserRole
 from ....api.dependencies.auth import get_current_user
 from ....api.dependencies.roles import require_role
+from ....core.metrics import metrics
 from ....services.ai_singleton import ai_service
+from ....services.station_geo_index import station_geo_index
+from ....services.map_tiles import invalidate_point
+from ....services.station_listing import (
+    DEFAULT_PAGE_SIZE,
+    list_stations_page,
+    parse_fields,
+)
+from ....services.station_cache import station_cache
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -17,10 +26,36 @@ router = APIRouter(prefix="/admin", tags=["Admin"])
     dependencies=[Depends(require_role(UserRole.admin))],
 )
 async def admin_list_stations(
+    response: Response,
+    cursor: str | None = Query(None),
+    limit: int | None = Query(None, ge=1, le=1000),
+    status: StationStatus | None = Query(None),
+    owner_id: int | None = Query(None, gt=0),
+    fields: str | None = Query(None, description="e.g. id,lat,lng,status"),
     session: AsyncSession = Depends(get_db_session),
 ):
-    result = await session.execute(select(Station))
-    return result.scalars().all()
+    """
+    Keyset-paginated on id once `cursor` or `limit` is sent (limit
+    defaults to 100 then); the next page cursor is returned in the
+    X-Next-Cursor header. Without either, every station is returned.
+    `fields` switches to a column projection.
+    """
+    if cursor is not None and limit is None:
+        limit = DEFAULT_PAGE_SIZE
+
+    items, next_cursor = await list_stations_page(
+        session,
+        cursor=cursor,
+        limit=limit,
+        status=status,
+        owner_id=owner_id,
+        fields=parse_fields(fields),
+    )
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return items
 
 
 @router.patch(
@@ -40,6 +75,10 @@ async def admin_update_station_status(
     station.status = new_status
     await session.commit()
 
+    station_cache.invalidate(station.id)
+    station_geo_index.sync(station)
+    invalidate_point(station.location_lat, station.location_lng)
+
     return {
         "station_id": station.id,
         "status": station.status,
@@ -53,15 +92,15 @@ async def admin_update_station_status(
 async def admin_critical_faults(
     session: AsyncSession = Depends(get_db_session),
 ):
-    stations = (await session.execute(select(Station))).scalars().all()
+    station_ids = (await session.execute(select(Station.id))).scalars().all()
+    results = await ai_service.analyze_stations(session, station_ids)
     critical = []
 
-    for station in stations:
-        result = await ai_service.analyze_station(session, station.id)
+    for station_id, result in results.items():
         if result["risk_level"] == "HIGH":
             critical.append(
                 {
-                    "station_id": station.id,
+                    "station_id": station_id,
                     "health_score": result["health_score"],
                     "anomalies": result["anomalies_detected"],
                 }
@@ -106,3 +145,14 @@ async def admin_enable_user(
     await session.commit()
 
     return {"user_id": user.id, "status": "enabled"}
+
+
+@router.get(
+    "/metrics",
+    dependencies=[Depends(require_role(UserRole.admin))],
+)
+async def admin_metrics():
+    """
+    Process-local counters, gauges and cache statistics.
+    """
+    return metrics.snapshot()
@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....db.session import get_db_session
 from ....services.ai_singleton import ai_service
-from ....models.models import Station
+from ....services.station_cache import station_cache
 from ....api.dependencies.auth import get_current_user
 from ....api.dependencies.roles import require_role
 from ....models.models import UserRole
@@ -19,7 +19,7 @@ async def analyze_station(
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
-    station = await session.get(Station, station_id)
+    station = await station_cache.get(session, station_id)
 
     if not station or station.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Access denied")
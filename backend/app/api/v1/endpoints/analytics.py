@@ -1,18 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func
 from datetime import datetime, timedelta
 
 from ....db.session import get_db_session
 from ....models.models import (
-    Station,
     Booking,
     BookingStatus,
-    StationTelemetry,
 )
 from ....api.dependencies.auth import get_current_user
 from ....api.dependencies.roles import require_role
 from ....models.models import UserRole
+from ....services.analytics_cache import ADMIN_SCOPE, analytics_cache, cache_scope
+from ....services.booking_analytics import (
+    Granularity,
+    booking_series,
+    parse_zone,
+    to_utc,
+)
+from ....services.telemetry_rollup import count_faults
+from ....services.station_cache import station_cache
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
@@ -25,7 +32,7 @@ async def station_analytics(
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
-    station = await session.get(Station, station_id)
+    station = await station_cache.get(session, station_id)
 
     if not station:
         raise HTTPException(404, "Station not found")
@@ -54,18 +61,11 @@ async def station_analytics(
 
     booking_count, revenue = booking_result.one()
 
-    # Fault count
-    fault_result = await session.execute(
-        select(func.count(StationTelemetry.id))
-        .where(
-            StationTelemetry.station_id == station_id,
-            StationTelemetry.timestamp >= since,
-            StationTelemetry.temperature > 80,
-        )
+    # Fault count (served from 1m / 1h rollups)
+    fault_count = await count_faults(
+        session, station_id, since, datetime.utcnow()
     )
 
-    fault_count = fault_result.scalar()
-
     return {
         "station_id": station_id,
         "last_24h": {
@@ -81,59 +81,90 @@ async def station_analytics(
     dependencies=[Depends(require_role(UserRole.station_owner, UserRole.admin))]
 )
 async def usage_analytics(
+    from_: datetime | None = Query(None, alias="from"),
+    to: datetime | None = Query(None),
+    tz: str = Query("UTC", description="IANA zone, e.g. Asia/Kolkata"),
+    granularity: Granularity = Query("day"),
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
-    base_query = select(
-        func.date(Booking.start_time),
-        func.count(Booking.id),
-    ).where(Booking.status == BookingStatus.completed)
-
-    if current_user.role == UserRole.station_owner:
-        base_query = base_query.join(
-            Station, Booking.station_id == Station.id
-        ).where(Station.owner_id == current_user.id)
-
-    result = await session.execute(
-        base_query.group_by(func.date(Booking.start_time))
-        .order_by(func.date(Booking.start_time))
+    """
+    Completed bookings per bucket (by start time), optionally limited
+    to [from, to). Naive from / to are read in `tz`; non-UTC or hourly
+    series need both bounds (see booking_series).
+    """
+    scope = cache_scope(current_user)
+    key = ("usage", from_, to, tz, granularity)
+
+    cached, cache_key = analytics_cache.get(scope, key)
+    if cached is not None:
+        return cached
+
+    zone = parse_zone(tz)
+
+    series = await booking_series(
+        session,
+        metric="usage",
+        owner_id=None if scope == ADMIN_SCOPE else scope,
+        since=to_utc(from_, zone),
+        until=to_utc(to, zone),
+        zone=zone,
+        granularity=granularity,
     )
 
-    return [
+    response = [
         {
-            "date": str(date),
-            "completed_bookings": count,
+            "date": bucket.isoformat(),
+            "completed_bookings": int(count),
         }
-        for date, count in result.all()
+        for bucket, count in series
     ]
+    analytics_cache.set(cache_key, response)
+    return response
 
 @router.get(
     "/revenue",
     dependencies=[Depends(require_role(UserRole.station_owner, UserRole.admin))]
 )
 async def revenue_analytics(
+    from_: datetime | None = Query(None, alias="from"),
+    to: datetime | None = Query(None),
+    tz: str = Query("UTC", description="IANA zone, e.g. Asia/Kolkata"),
+    granularity: Granularity = Query("day"),
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
-    base_query = select(
-        func.date(Booking.end_time),
-        func.sum(Booking.total_cost),
-    ).where(Booking.status == BookingStatus.completed)
-
-    if current_user.role == UserRole.station_owner:
-        base_query = base_query.join(
-            Station, Booking.station_id == Station.id
-        ).where(Station.owner_id == current_user.id)
-
-    result = await session.execute(
-        base_query.group_by(func.date(Booking.end_time))
-        .order_by(func.date(Booking.end_time))
+    """
+    Completed-booking revenue per bucket (by end time), optionally
+    limited to [from, to). Naive from / to are read in `tz`; non-UTC or
+    hourly series need both bounds (see booking_series).
+    """
+    scope = cache_scope(current_user)
+    key = ("revenue", from_, to, tz, granularity)
+
+    cached, cache_key = analytics_cache.get(scope, key)
+    if cached is not None:
+        return cached
+
+    zone = parse_zone(tz)
+
+    series = await booking_series(
+        session,
+        metric="revenue",
+        owner_id=None if scope == ADMIN_SCOPE else scope,
+        since=to_utc(from_, zone),
+        until=to_utc(to, zone),
+        zone=zone,
+        granularity=granularity,
     )
 
-    return [
+    response = [
         {
-            "date": str(date),
-            "revenue": revenue or 0,
+            "date": bucket.isoformat(),
+            "revenue": revenue,
         }
-        for date, revenue in result.all()
+        for bucket, revenue in series
     ]
+    analytics_cache.set(cache_key, response)
+    return response
+
@@ -1,15 +1,33 @@
-from fastapi import Path, APIRouter, Depends, HTTPException, status
+from datetime import datetime
+
+from fastapi import Path, APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, and_
-from sqlalchemy.engine import CursorResult
+from sqlalchemy import update
 
 from ....db.session import get_db_session
-from ....models.models import Booking, Station, BookingStatus, User
-from ....schemas.booking import BookingCreate, BookingDetailRead, BookingRead
-from ....api.dependencies.auth import get_current_user
+from ....models.models import Booking, BookingStatus, User
+from ....schemas.booking import (
+    BookingBulkCreate,
+    BookingBulkItem,
+    BookingBulkRead,
+    BookingCreate,
+    BookingDetailRead,
+    BookingRead,
+)
 from ....api.dependencies.auth import get_current_user
+from ....core.timeutils import as_naive_utc
+from ....services.analytics_cache import analytics_cache
+from ....services.booking_index import booking_index
+from ....services.booking_listing import DEFAULT_PAGE_SIZE, list_user_bookings_page
+from ....services.booking_writes import (
+    booking_context,
+    insert_booking,
+    insert_bookings_bulk,
+)
+from ....services.daily_stats import record_cancelled
+from ....services.map_tiles import invalidate_point
+from ....services.station_cache import station_cache
 from ....models.models import Booking
-from sqlalchemy import select, desc
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
@@ -21,93 +39,157 @@ async def create_booking(
     session: AsyncSession = Depends(get_db_session),
 ):
     """
-    Optimistic locking algorithm:
-    1. Check overlapping bookings.
-    2. Lock station using version compare-and-swap.
-    3. Insert booking only if version update succeeds.
+    Conditional-insert algorithm:
+    1. Station + its upcoming bookings from the caches (one combined
+       read when cold); reject slots the interval index knows are taken.
+    2. INSERT … SELECT guarded by NOT EXISTS(overlapping confirmed booking).
+    3. COMMIT.
+
+    409 when the slot is taken, 503 + Retry-After when lock retries
+    run out (see insert_booking).
     """
+    # Stored (naive UTC) values: used for checks, the index and the response
+    start_time = as_naive_utc(payload.start_time)
+    end_time = as_naive_utc(payload.end_time)
 
-    # 1. Overlap check (SELECT → Result[Booking])
-    overlap_stmt = select(Booking).where(
-        and_(
-            Booking.station_id == payload.station_id,
-            Booking.status == BookingStatus.confirmed,
-            Booking.start_time < payload.end_time,
-            Booking.end_time > payload.start_time,
+    # 1. Cheap in-memory prune (advisory; MySQL stays authoritative)
+    station, intervals = await booking_context(session, payload.station_id)
+
+    if station is None:
+        raise HTTPException(status_code=404, detail="Station not found")
+
+    if intervals.overlaps(start_time, end_time):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Time slot already booked",
         )
-    )
 
-    overlap_result = await session.execute(overlap_stmt)
-    existing_booking = overlap_result.scalars().first()
+    # 2 + 3. Two round trips
+    booking_id = await insert_booking(
+        session,
+        current_user.id,
+        payload.station_id,
+        start_time,
+        end_time,
+    )
 
-    if existing_booking:
+    if booking_id is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Time slot already booked",
         )
 
-    # 2. Fetch station (SELECT → Result[Station])
-    station_stmt = select(Station).where(Station.id == payload.station_id)
-    station_result = await session.execute(station_stmt)
-    station = station_result.scalar_one_or_none()
+    booking_index.add(payload.station_id, booking_id, start_time, end_time)
+    invalidate_point(station.location_lat, station.location_lng)
+    analytics_cache.invalidate_owner(station.owner_id)
 
-    if not station:
+    return BookingRead(
+        id=booking_id,
+        user_id=current_user.id,
+        station_id=payload.station_id,
+        start_time=start_time,
+        end_time=end_time,
+        status=BookingStatus.confirmed,
+        version=1,
+    )
+
+@router.post("/bulk", response_model=BookingBulkRead)
+async def create_bookings_bulk(
+    payload: BookingBulkCreate,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Books a list of windows (or a daily/weekly recurrence) on one station:
+    - Windows the booking index knows are taken are rejected up front
+    - The rest in span-capped chunks, each one range-locked read of
+      existing confirmed bookings, one multi-row INSERT, one COMMIT
+    - Per-window result, in request order
+    """
+    station, intervals = await booking_context(session, payload.station_id)
+
+    if station is None:
         raise HTTPException(status_code=404, detail="Station not found")
 
-    current_version = station.version
+    # Stored (naive UTC) values: used for checks, the index and the response
+    windows = [
+        (as_naive_utc(window.start_time), as_naive_utc(window.end_time))
+        for window in payload.requested_windows()
+    ]
 
-    # 3. Atomic version update (UPDATE → CursorResult)
-    update_stmt = (
-        update(Station)
-        .where(
-            Station.id == payload.station_id,
-            Station.version == current_version,
-        )
-        .values(version=Station.version + 1)
+    outcomes = await insert_bookings_bulk(
+        session,
+        current_user.id,
+        payload.station_id,
+        station.price_per_hour,
+        windows,
+        known=intervals,
     )
 
-    update_result: CursorResult = await session.execute(update_stmt)
+    results = []
 
-    if update_result.rowcount == 0:
-        await session.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Slot already reserved by another user",
+    for (start_time, end_time), (booking_id, detail) in zip(windows, outcomes):
+        if booking_id is not None:
+            booking_index.add(payload.station_id, booking_id, start_time, end_time)
+
+        results.append(
+            BookingBulkItem(
+                start_time=start_time,
+                end_time=end_time,
+                status="created" if booking_id is not None else "conflict",
+                booking_id=booking_id,
+                detail=detail,
+            )
         )
 
-    duration_hours = (
-        (payload.end_time - payload.start_time).total_seconds() / 3600
-    )
+    created = sum(1 for item in results if item.booking_id is not None)
 
-    cost = round(duration_hours * station.price_per_hour, 2)
+    if created:
+        invalidate_point(station.location_lat, station.location_lng)
+        analytics_cache.invalidate_owner(station.owner_id)
 
-    booking = Booking(
-        user_id=current_user.id,
+    return BookingBulkRead(
         station_id=payload.station_id,
-        start_time=payload.start_time,
-        end_time=payload.end_time,
-        total_cost=cost,
-        status=BookingStatus.confirmed,
-        version=1,
+        created=created,
+        conflicts=len(results) - created,
+        results=results,
     )
 
-    session.add(booking)
-    await session.commit()
-    await session.refresh(booking)
-
-    return booking
 
 @router.get("/my", response_model=list[BookingDetailRead])
 async def my_bookings(
+    response: Response,
+    cursor: str | None = Query(None),
+    limit: int | None = Query(None, ge=1, le=500),
+    status: BookingStatus | None = Query(None),
+    from_: datetime | None = Query(None, alias="from"),
+    to: datetime | None = Query(None),
     current_user=Depends(get_current_user),
     session: AsyncSession = Depends(get_db_session),
 ):
-    result = await session.execute(
-        select(Booking)
-        .where(Booking.user_id == current_user.id)
-        .order_by(desc(Booking.start_time))
+    """
+    Ordered by (start_time, id); keyset-paginated once `cursor` or
+    `limit` is sent (limit defaults to 50 then), with the next page
+    cursor in the X-Next-Cursor header. Without either, every booking
+    is returned. from / to filter on start_time.
+    """
+    if cursor is not None and limit is None:
+        limit = DEFAULT_PAGE_SIZE
+
+    rows, next_cursor = await list_user_bookings_page(
+        session,
+        user_id=current_user.id,
+        cursor=cursor,
+        limit=limit,
+        status=status,
+        since=from_,
+        until=to,
     )
-    return result.scalars().all()
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return rows
 
 
 @router.get("/{booking_id}", response_model=BookingDetailRead)
@@ -141,9 +223,33 @@ async def cancel_booking(
             detail="Only confirmed bookings can be cancelled",
         )
 
-    booking.status = BookingStatus.cancelled
+    # Guarded flip: loses cleanly against the lifecycle job completing it
+    result = await session.execute(
+        update(Booking)
+        .where(
+            Booking.id == booking.id,
+            Booking.status == BookingStatus.confirmed,
+        )
+        .values(status=BookingStatus.cancelled)
+    )
+
+    if result.rowcount == 0:
+        await session.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="Only confirmed bookings can be cancelled",
+        )
+
+    await record_cancelled(session, booking.station_id, booking.start_time)
     await session.commit()
 
+    booking_index.remove(booking.station_id, booking.id, booking.start_time)
+
+    station = await station_cache.get(session, booking.station_id)
+    if station is not None:
+        invalidate_point(station.location_lat, station.location_lng)
+        analytics_cache.invalidate_owner(station.owner_id)
+
     return {
         "booking_id": booking.id,
         "status": "cancelled",
@@ -1,9 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Path
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
 
 from ....db.session import get_db_session
-from ....models.models import StationTelemetry
+from ....services.telemetry_ring import telemetry_ring
 
 router = APIRouter(prefix="/chargers", tags=["Charger Status"])
 
@@ -14,26 +13,26 @@ async def charger_status(
 ):
     """
     charger_id maps to station_id (v1 design).
+    Latest reading comes from the ring buffer (DB only on cold start).
     """
-    result = await session.execute(
-        select(StationTelemetry)
-        .where(StationTelemetry.station_id == charger_id)
-        .order_by(desc(StationTelemetry.timestamp))
-        .limit(1)
-    )
+    telemetry = telemetry_ring.latest(charger_id)
 
-    telemetry = result.scalar_one_or_none()
+    if telemetry is None:
+        await telemetry_ring.warm_up(session, charger_id)
+        telemetry = telemetry_ring.latest(charger_id)
 
-    if not telemetry:
+    if telemetry is None:
         return {
             "charger_id": charger_id,
             "status": "NO_DATA",
         }
 
+    voltage, current, temperature, timestamp = telemetry
+
     # Simple, deterministic rules
-    if telemetry.temperature > 80:
+    if temperature > 80:
         status = "OVERHEAT"
-    elif telemetry.voltage < 180:
+    elif voltage < 180:
         status = "UNDERVOLTAGE"
     else:
         status = "NORMAL"
@@ -41,8 +40,8 @@ async def charger_status(
     return {
         "charger_id": charger_id,
         "status": status,
-        "voltage": telemetry.voltage,
-        "current": telemetry.current,
-        "temperature": telemetry.temperature,
-        "timestamp": telemetry.timestamp,
+        "voltage": voltage,
+        "current": current,
+        "temperature": temperature,
+        "timestamp": timestamp,
     }
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from datetime import datetime, timedelta
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, exists
+from sqlalchemy import select, func, exists
 
 from ....db.session import get_db_session
 from ....models.models import Station
@@ -9,6 +10,12 @@ from ....models.models import Booking
 from ....models.models import BookingStatus, StationStatus, UserRole
 from ....api.dependencies.roles import require_role
 from ....services.ai_singleton import ai_service 
+from ....services.geo import near, within_box
+from ....services.map_tiles import MAX_ZOOM, cache_for, cluster, tile_bounds
+from ....services.slot_search import earliest_slots
+from ....services.station_geo_index import station_geo_index
+from ....services.telemetry_ring import from_epoch, to_epoch
+from ....core.config import settings
 
 router = APIRouter(prefix="/driver", tags=["Driver"])
 
@@ -25,7 +32,8 @@ async def driver_station_map(
 ):
     """
     Driver map view:
-    - Spatially filtered & distance-sorted stations (DB-side)
+    - Spatially filtered & distance-sorted stations
+      (MySQL or in-memory index, per STATION_MAP_ENGINE)
     - Availability window (15 min)
     - AI health status
     """
@@ -33,54 +41,277 @@ async def driver_station_map(
     now = datetime.utcnow()
     window_end = now + timedelta(minutes=15)
 
-    # Spatial distance (meters)
-    user_point = func.ST_SRID(func.POINT(user_lng, user_lat), 4326)
-    distance_m = func.ST_Distance_Sphere(Station.location, user_point)
+    if settings.STATION_MAP_ENGINE == "memory":
+        hits = station_geo_index.radius(user_lat, user_lng, radius_km)
+        station_ids = [entry.station_id for entry, _ in hits]
 
-    # Fetch nearby active stations
-    stmt = (
-        select(
-            Station,
-            (distance_m / 1000).label("distance_km"),
-        )
-        .where(Station.status == StationStatus.active)
-        .where(distance_m <= radius_km * 1000)
-        .order_by(distance_m.asc())
-    )
+        occupied_ids = set()
+        if station_ids:
+            occupied_ids = set(
+                (
+                    await session.execute(
+                        select(Booking.station_id)
+                        .where(
+                            Booking.station_id.in_(station_ids),
+                            Booking.start_time < window_end,
+                            Booking.end_time > now,
+                            Booking.status == BookingStatus.confirmed,
+                        )
+                        .distinct()
+                    )
+                ).scalars()
+            )
+
+        rows = [
+            (
+                entry.station_id,
+                entry.lat,
+                entry.lng,
+                entry.price_per_hour,
+                distance_km,
+                entry.station_id in occupied_ids,
+            )
+            for entry, distance_km in hits
+        ]
 
-    rows = (await session.execute(stmt)).all()
+    else:
+        # Spatial distance (meters)
+        user_point = func.ST_SRID(func.POINT(user_lng, user_lat), 4326)
+        distance_m = func.ST_Distance_Sphere(Station.location, user_point)
 
-    response = []
+        # Availability: correlated EXISTS served by idx_booking_station_time
+        occupied = (
+            exists()
+            .where(
+                Booking.station_id == Station.id,
+                Booking.start_time < window_end,
+                Booking.end_time > now,
+                Booking.status == BookingStatus.confirmed,
+            )
+            .label("occupied")
+        )
 
-    for station, distance_km in rows:
-        # Availability check
-        overlap = await session.execute(
+        # Fetch nearby active stations with availability in one statement
+        stmt = (
             select(
-                exists().where(
-                    and_(
-                        Booking.station_id == station.id,
-                        Booking.status == BookingStatus.confirmed,
-                        Booking.start_time < window_end,
-                        Booking.end_time > now,
-                    )
-                )
+                Station.id,
+                Station.location_lat,
+                Station.location_lng,
+                Station.price_per_hour,
+                (distance_m / 1000).label("distance_km"),
+                occupied,
             )
+            .where(Station.status == StationStatus.active)
+            # R-tree prefilter on the bounding box, exact sphere check after
+            .where(near(user_lat, user_lng, radius_km))
+            .where(distance_m <= radius_km * 1000)
+            .order_by(distance_m.asc())
         )
 
-        availability = "OCCUPIED" if overlap.scalar() else "AVAILABLE"
+        rows = (await session.execute(stmt)).all()
+
+    # Health: ring-buffer backed, at most one batched DB read
+    ai_results = await ai_service.analyze_stations(
+        session, [row[0] for row in rows]
+    )
+
+    response = []
 
-        ai_result = await ai_service.analyze_station(session, station.id)
+    for station_id, lat, lng, price_per_hour, distance_km, is_occupied in rows:
+        ai_result = ai_results[station_id]
         health = "CRITICAL" if ai_result["risk_level"] == "HIGH" else "OK"
 
         response.append(
             {
-                "station_id": station.id,
-                "lat": station.location_lat,
-                "lng": station.location_lng,
+                "station_id": station_id,
+                "lat": lat,
+                "lng": lng,
                 "distance_km": round(distance_km, 2),
-                "availability": availability,
+                "availability": "OCCUPIED" if is_occupied else "AVAILABLE",
                 "health": health,
-                "price_per_hour": station.price_per_hour,
+                "price_per_hour": price_per_hour,
+            }
+        )
+
+    return response
+
+
+@router.get(
+    "/stations/tiles/{z}/{x}/{y}",
+    dependencies=[Depends(require_role(UserRole.driver))],
+)
+async def driver_station_tile(
+    z: int = Path(..., ge=0, le=MAX_ZOOM),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Zoomed-out map view:
+    - Active stations in one slippy-map tile, clustered on a grid
+    - Per cluster: count, centroid, available & critical counts
+    - Cached per tile; invalidated on station status / booking changes,
+      except overview zooms (<= MAP_TILE_OVERVIEW_MAX_ZOOM), which only
+      refresh after their TTL
+    """
+    if x >= 2 ** z or y >= 2 ** z:
+        raise HTTPException(status_code=404, detail="Tile out of range")
+
+    cache = cache_for(z)
+    clusters = cache.get((z, x, y))
+
+    if clusters is None:
+        now = datetime.utcnow()
+        window_end = now + timedelta(minutes=15)
+        bounds = tile_bounds(z, x, y)
+
+        occupied = (
+            exists()
+            .where(
+                Booking.station_id == Station.id,
+                Booking.start_time < window_end,
+                Booking.end_time > now,
+                Booking.status == BookingStatus.confirmed,
+            )
+            .label("occupied")
+        )
+
+        rows = (
+            await session.execute(
+                select(
+                    Station.id,
+                    Station.location_lat,
+                    Station.location_lng,
+                    occupied,
+                )
+                .where(Station.status == StationStatus.active)
+                .where(within_box(*bounds))
+            )
+        ).all()
+
+        ai_results = await ai_service.analyze_stations(
+            session, [row.id for row in rows]
+        )
+
+        clusters = cluster(
+            bounds,
+            np.array([row.location_lat for row in rows], dtype=np.float64),
+            np.array([row.location_lng for row in rows], dtype=np.float64),
+            np.array([not row.occupied for row in rows], dtype=np.float64),
+            np.array(
+                [ai_results[row.id]["risk_level"] == "HIGH" for row in rows],
+                dtype=np.float64,
+            ),
+        )
+        cache.set((z, x, y), clusters)
+
+    return {"z": z, "x": x, "y": y, "clusters": clusters}
+
+
+@router.get(
+    "/slots",
+    dependencies=[Depends(require_role(UserRole.driver))],
+)
+async def driver_free_slots(
+    user_lat: float = Query(..., description="Driver latitude"),
+    user_lng: float = Query(..., description="Driver longitude"),
+    radius_km: float = Query(50.0, gt=0),
+    duration_minutes: int = Query(60, gt=0, le=24 * 60),
+    horizon_hours: int = Query(24, gt=0, le=7 * 24),
+    limit: int = Query(20, gt=0, le=100),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Earliest bookable window per nearby station:
+    - Nearby active stations (same engine as the map view)
+    - All confirmed bookings in the horizon, fetched in one query
+    - Vectorized interval sweep → earliest free [start, start + duration)
+    - Sorted by start time, then distance
+    """
+    # Slots start on whole minutes
+    now = datetime.utcnow().replace(second=0, microsecond=0) + timedelta(minutes=1)
+    horizon_end = now + timedelta(hours=horizon_hours)
+
+    if settings.STATION_MAP_ENGINE == "memory":
+        stations = [
+            (entry.station_id, entry.lat, entry.lng, entry.price_per_hour, distance_km)
+            for entry, distance_km in station_geo_index.radius(
+                user_lat, user_lng, radius_km
+            )
+        ]
+    else:
+        user_point = func.ST_SRID(func.POINT(user_lng, user_lat), 4326)
+        distance_m = func.ST_Distance_Sphere(Station.location, user_point)
+
+        stations = (
+            await session.execute(
+                select(
+                    Station.id,
+                    Station.location_lat,
+                    Station.location_lng,
+                    Station.price_per_hour,
+                    (distance_m / 1000).label("distance_km"),
+                )
+                .where(Station.status == StationStatus.active)
+                .where(near(user_lat, user_lng, radius_km))
+                .where(distance_m <= radius_km * 1000)
+            )
+        ).all()
+
+    if not stations:
+        return []
+
+    rank_of = {row[0]: rank for rank, row in enumerate(stations)}
+
+    bookings = (
+        await session.execute(
+            select(Booking.station_id, Booking.start_time, Booking.end_time)
+            .where(
+                Booking.station_id.in_(rank_of),
+                Booking.status == BookingStatus.confirmed,
+                Booking.start_time < horizon_end,
+                Booking.end_time > now,
+            )
+        )
+    ).all()
+
+    ranks = np.array([rank_of[b.station_id] for b in bookings], dtype=np.int64)
+    starts = to_epoch([b.start_time for b in bookings])
+    ends = to_epoch([b.end_time for b in bookings])
+
+    order = np.lexsort((starts, ranks))
+    duration_s = duration_minutes * 60
+
+    slots = earliest_slots(
+        len(stations),
+        ranks[order],
+        starts[order],
+        ends[order],
+        to_epoch([now])[0],
+        to_epoch([horizon_end])[0],
+        duration_s,
+    )
+
+    found = np.flatnonzero(~np.isnan(slots))
+    distances = np.array([row[4] for row in stations], dtype=np.float64)
+    found = found[np.lexsort((distances[found], slots[found]))][:limit]
+
+    slot_starts = from_epoch(slots[found])
+    slot_ends = from_epoch(slots[found] + duration_s)
+
+    response = []
+
+    for i, start_time, end_time in zip(found.tolist(), slot_starts, slot_ends):
+        station_id, lat, lng, price_per_hour, distance_km = stations[i]
+        response.append(
+            {
+                "station_id": station_id,
+                "lat": lat,
+                "lng": lng,
+                "distance_km": round(distance_km, 2),
+                "start_time": start_time,
+                "end_time": end_time,
+                "estimated_cost": round(duration_minutes / 60 * price_per_hour, 2),
             }
         )
 
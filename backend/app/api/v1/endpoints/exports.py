@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....db.session import get_db_session
+from ....models.models import Booking, BookingStatus, Station, StationTelemetry, UserRole
+from ....api.dependencies.auth import get_current_user
+from ....api.dependencies.roles import require_role
+from ....core.config import settings
+from ....core.timeutils import as_naive_utc
+from ....services.exports import MEDIA_TYPES, ExportFormat, stream_export
+from ....services.station_cache import station_cache
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+
+async def _check_station_access(session: AsyncSession, station_id: int, current_user):
+    station = await station_cache.get(session, station_id)
+
+    if not station:
+        raise HTTPException(404, "Station not found")
+
+    if (
+        current_user.role == UserRole.station_owner
+        and station.owner_id != current_user.id
+    ):
+        raise HTTPException(403, "Access denied")
+
+
+def _export_response(stmt, fmt: ExportFormat, name: str) -> StreamingResponse:
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    return StreamingResponse(
+        stream_export(stmt, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}-{stamp}.{fmt}"'
+        },
+    )
+
+
+@router.get(
+    "/bookings",
+    dependencies=[Depends(require_role(UserRole.station_owner, UserRole.admin))],
+)
+async def export_bookings(
+    format: ExportFormat = Query("csv"),
+    from_: datetime | None = Query(None, alias="from"),
+    to: datetime | None = Query(None),
+    station_id: int | None = Query(None, gt=0),
+    status: BookingStatus | None = Query(None),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """
+    Streams bookings (owners: their stations only) ordered by start time.
+    from / to filter on start_time, [from, to).
+    """
+    stmt = select(
+        Booking.id,
+        Booking.user_id,
+        Booking.station_id,
+        Booking.start_time,
+        Booking.end_time,
+        Booking.status,
+        Booking.total_cost,
+    )
+
+    if station_id is not None:
+        await _check_station_access(session, station_id, current_user)
+        stmt = stmt.where(Booking.station_id == station_id)
+    elif current_user.role == UserRole.station_owner:
+        stmt = stmt.where(
+            Booking.station_id.in_(
+                select(Station.id).where(Station.owner_id == current_user.id)
+            )
+        )
+
+    if status is not None:
+        stmt = stmt.where(Booking.status == status)
+    if from_ is not None:
+        stmt = stmt.where(Booking.start_time >= as_naive_utc(from_))
+    if to is not None:
+        stmt = stmt.where(Booking.start_time < as_naive_utc(to))
+
+    return _export_response(
+        stmt.order_by(Booking.start_time, Booking.id), format, "bookings"
+    )
+
+
+@router.get(
+    "/telemetry",
+    dependencies=[Depends(require_role(UserRole.station_owner, UserRole.admin))],
+)
+async def export_telemetry(
+    format: ExportFormat = Query("csv"),
+    from_: datetime | None = Query(None, alias="from"),
+    to: datetime | None = Query(None),
+    station_id: int | None = Query(None, gt=0),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """
+    Streams raw telemetry (owners: their stations only), ordered by
+    station then time; defaults to the last 24 hours.
+    Raw rows are kept for TELEMETRY_RETENTION_DAYS only; ranges longer
+    than EXPORT_TELEMETRY_MAX_DAYS need station_id.
+    """
+    until = as_naive_utc(to) if to else datetime.utcnow()
+    since = as_naive_utc(from_) if from_ else until - timedelta(hours=24)
+
+    if since >= until:
+        raise HTTPException(400, "from must be before to")
+
+    if station_id is None and until - since > timedelta(days=settings.EXPORT_TELEMETRY_MAX_DAYS):
+        raise HTTPException(
+            400,
+            f"Ranges over {settings.EXPORT_TELEMETRY_MAX_DAYS} days require station_id",
+        )
+
+    if until - since > timedelta(days=settings.TELEMETRY_RETENTION_DAYS):
+        raise HTTPException(
+            400,
+            f"Range exceeds the {settings.TELEMETRY_RETENTION_DAYS}-day telemetry retention",
+        )
+
+    stmt = select(
+        StationTelemetry.station_id,
+        StationTelemetry.timestamp,
+        StationTelemetry.voltage,
+        StationTelemetry.current,
+        StationTelemetry.temperature,
+    ).where(
+        StationTelemetry.timestamp >= since,
+        StationTelemetry.timestamp < until,
+    )
+
+    if station_id is not None:
+        await _check_station_access(session, station_id, current_user)
+        stmt = stmt.where(StationTelemetry.station_id == station_id)
+    elif current_user.role == UserRole.station_owner:
+        stmt = stmt.where(
+            StationTelemetry.station_id.in_(
+                select(Station.id).where(Station.owner_id == current_user.id)
+            )
+        )
+
+    return _export_response(
+        stmt.order_by(StationTelemetry.station_id, StationTelemetry.timestamp),
+        format,
+        "telemetry",
+    )
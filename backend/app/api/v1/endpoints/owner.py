@@ -7,6 +7,9 @@ from ....models.models import Station
 from ....api.dependencies.auth import get_current_user
 from ....api.dependencies.roles import require_role
 from ....models.models import UserRole
+from ....services.analytics_cache import analytics_cache
+from ....services.station_geo_index import station_geo_index
+from ....services.station_cache import station_cache
 
 router = APIRouter(prefix="/owner", tags=["Owner"])
 
@@ -58,10 +61,16 @@ async def update_station_pricing(
     station.price_per_hour = price_per_hour
     await session.commit()
 
+    station_cache.invalidate(station.id)
+    station_geo_index.sync(station)
+
     return {"station_id": station.id, "price_per_hour": station.price_per_hour}
 
-from sqlalchemy import func
-from ....models.models import Booking, BookingStatus
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import aliased
+from ....models.models import Booking, BookingStatus, StationDailyStats
 
 @router.get(
     "/revenue",
@@ -71,37 +80,96 @@ async def owner_revenue(
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
-    result = await session.execute(
-        select(
-            func.sum(Booking.total_cost),
-            func.count(Booking.id),
+    """
+    One statement:
+    - All-time totals from station_daily_stats (scalar subqueries)
+    - Active bookings: every confirmed booking (scalar subquery on
+      idx_booking_station_status_end; the lifecycle job keeps past
+      ones few by completing them)
+    - Rolling this-week / last-week revenue by conditional aggregation
+      over a sargable end_time range, served index-only by
+      idx_booking_station_status_end
+    """
+    cached, cache_key = analytics_cache.get(current_user.id, ("owner_revenue",))
+    if cached is not None:
+        return cached
+
+    now = datetime.utcnow()
+    week_start = now - timedelta(days=7)
+    last_week_start = now - timedelta(days=14)
+
+    stats = StationDailyStats
+    owned = select(Station.id).where(Station.owner_id == current_user.id)
+
+    def all_time(column):
+        return (
+            select(func.coalesce(func.sum(column), 0))
+            .where(stats.station_id.in_(owned))
+            .scalar_subquery()
         )
-        .join(Station)
+
+    confirmed = aliased(Booking)
+    active_bookings = (
+        select(func.count())
+        .select_from(confirmed)
         .where(
-            Station.owner_id == current_user.id,
-            Booking.status == BookingStatus.completed,
+            confirmed.station_id.in_(owned),
+            confirmed.status == BookingStatus.confirmed,
         )
+        .scalar_subquery()
     )
 
-    total_revenue, completed_count = result.one()
+    completed = Booking.status == BookingStatus.completed
+
+    def revenue_between(start, end):
+        return func.coalesce(
+            func.sum(
+                case(
+                    (
+                        completed
+                        & (Booking.end_time >= start)
+                        & (Booking.end_time < end),
+                        Booking.total_cost,
+                    ),
+                    else_=0,
+                )
+            ),
+            0,
+        )
 
-    active = await session.execute(
-        select(func.count(Booking.id))
-        .join(Station)
-        .where(
-            Station.owner_id == current_user.id,
-            Booking.status == BookingStatus.confirmed,
+    result = await session.execute(
+        select(
+            all_time(stats.revenue),
+            all_time(stats.completed_bookings),
+            revenue_between(week_start, now),
+            revenue_between(last_week_start, week_start),
+            active_bookings,
+        ).where(
+            Booking.station_id.in_(owned),
+            completed,
+            Booking.end_time >= last_week_start,
         )
     )
 
-    return {
-        "total": float(total_revenue or 0),
-        "this_week": float(total_revenue or 0),  # placeholder
-        "growth_percentage": None,
+    total_revenue, completed_count, this_week, last_week, active = result.one()
+
+    growth = (
+        round((this_week - last_week) / last_week * 100, 2)
+        if last_week
+        else None
+    )
+
+    response = {
+        "total": float(total_revenue),
+        "this_week": float(this_week),
+        "last_week": float(last_week),
+        "growth_percentage": growth,
         "period": "All time",
-        "completed_bookings": completed_count or 0,
-        "active_bookings": active.scalar(),
+        "completed_bookings": int(completed_count),
+        "active_bookings": int(active),
     }
+    analytics_cache.set(cache_key, response)
+    return response
 
 
 
@@ -113,21 +181,25 @@ async def owner_revenue_breakdown(
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
+    cached, cache_key = analytics_cache.get(current_user.id, ("owner_revenue_breakdown",))
+    if cached is not None:
+        return cached
+
+    stats = StationDailyStats
+    revenue = func.sum(stats.revenue)
+
     result = await session.execute(
-        select(
-            func.date(Booking.end_time),
-            func.sum(Booking.total_cost),
-        )
-        .join(Station)
-        .where(
-            Station.owner_id == current_user.id,
-            Booking.status == BookingStatus.completed,
-        )
-        .group_by(func.date(Booking.end_time))
-        .order_by(func.date(Booking.end_time))
+        select(stats.day, revenue)
+        .join(Station, stats.station_id == Station.id)
+        .where(Station.owner_id == current_user.id)
+        .group_by(stats.day)
+        .having(revenue > 0)
+        .order_by(stats.day)
     )
 
-    return [
+    response = [
         {"date": str(date), "revenue": revenue}
         for date, revenue in result.all()
     ]
+    analytics_cache.set(cache_key, response)
+    return response
@@ -1,13 +1,22 @@
-from fastapi import Path,APIRouter, Depends, HTTPException
+from fastapi import Path,APIRouter, Depends, HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from ....db.session import get_db_session
-from ....models.models import Station
+from ....models.models import Station, StationStatus
 from ....schemas.station import StationCreate, StationRead
 from ....api.dependencies.auth import get_current_user
 from ....api.dependencies.roles import require_role
 from ....models.models import UserRole
+from ....services.station_geo_index import station_geo_index
+from ....services.map_tiles import invalidate_point
+from ....services.station_listing import (
+    DEFAULT_PAGE_SIZE,
+    list_stations_page,
+    parse_fields,
+)
+from ....services.station_cache import station_cache
 
 router = APIRouter(prefix="/stations", tags=["Stations"])
 
@@ -34,15 +43,48 @@ async def create_station(
     session.add(station)
     await session.commit()
     await session.refresh(station)
+
+    station_cache.invalidate(station.id)
+    station_geo_index.sync(station)
+    invalidate_point(station.location_lat, station.location_lng)
     return station
 
 
 @router.get("/", response_model=list[StationRead])
 async def list_stations(
+    response: Response,
+    cursor: str | None = Query(None),
+    limit: int | None = Query(None, ge=1, le=1000),
+    status: StationStatus | None = Query(None),
+    owner_id: int | None = Query(None, gt=0),
+    fields: str | None = Query(None, description="e.g. id,lat,lng,status"),
     session: AsyncSession = Depends(get_db_session),
 ):
-    result = await session.execute(select(Station))
-    return result.scalars().all()
+    """
+    Keyset-paginated on id once `cursor` or `limit` is sent (limit
+    defaults to 100 then); the next page cursor is returned in the
+    X-Next-Cursor header. Without either, every station is returned.
+    `fields` switches to a column projection.
+    """
+    if cursor is not None and limit is None:
+        limit = DEFAULT_PAGE_SIZE
+
+    items, next_cursor = await list_stations_page(
+        session,
+        cursor=cursor,
+        limit=limit,
+        status=status,
+        owner_id=owner_id,
+        fields=parse_fields(fields),
+    )
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+
+    if fields:
+        # Partial rows bypass the StationRead response model
+        return JSONResponse(jsonable_encoder(items), headers=headers)
+
+    response.headers.update(headers)
+    return items
 
 @router.patch(
     "/{station_id}/pricing",
@@ -62,6 +104,9 @@ async def update_station_pricing(
     station.price_per_hour = price_per_hour
     await session.commit()
 
+    station_cache.invalidate(station.id)
+    station_geo_index.sync(station)
+
     return {"status": "pricing updated"}
 
 @router.get("/{station_id}")
@@ -1,15 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime, timedelta
+from enum import Enum
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, func, and_, or_
 
 from ....db.session import get_db_session
-from ....models.models import Station, StationTelemetry
+from ....models.models import StationTelemetry
+from ....db.pagination import encode_cursor, decode_cursor
+from ....services.downsampling import lttb
+from ....schemas.telemetry import TelemetryIngest
 from ....api.dependencies.auth import get_current_user
 from ....api.dependencies.roles import require_role
 from ....models.models import UserRole
+from ....core.config import settings
+from ....core.timeutils import as_naive_utc
+from ....services.telemetry_buffer import telemetry_buffer
+from ....services.telemetry_ring import telemetry_ring, from_epoch
+from ....services.station_cache import station_cache
 
 router = APIRouter(prefix="/telemetry", tags=["Telemetry"])
 
+# Compact binary body: packed little-endian records, 28 bytes each.
+# timestamp is Unix seconds (UTC); 0 means "use server receive time".
+BINARY_READING = np.dtype(
+    [
+        ("station_id", "<i8"),
+        ("timestamp", "<f8"),
+        ("voltage", "<f4"),
+        ("current", "<f4"),
+        ("temperature", "<f4"),
+    ]
+)
+
 
 @router.get(
     "/station/{station_id}",
@@ -20,16 +45,381 @@ async def get_station_telemetry(
     session: AsyncSession = Depends(get_db_session),
     current_user=Depends(get_current_user),
 ):
-    station = await session.get(Station, station_id)
+    station = await station_cache.get(session, station_id)
+
+    if not station or station.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    # Served from the ring buffer; the DB is only read on a cold start
+    await telemetry_ring.warm_up(session, station_id)
+    window = telemetry_ring.window(station_id, 100)
+
+    # No readings anywhere yet (e.g. a newly created station)
+    if window is None:
+        return []
+
+    values, timestamps = window
+
+    return [
+        {
+            "station_id": station_id,
+            "voltage": voltage,
+            "current": current,
+            "temperature": temperature,
+            "timestamp": timestamp,
+        }
+        for (voltage, current, temperature), timestamp in zip(
+            values.tolist(), from_epoch(timestamps)
+        )
+    ]
+
+
+class DownsampleMode(str, Enum):
+    none = "none"
+    lttb = "lttb"
+    minmax = "minmax"
+
+
+# LTTB candidates: SQL keeps the min and max row of this many
+# buckets per requested point, LTTB then picks among them
+LTTB_CANDIDATE_BUCKETS = 4
+
+
+def _time_bucket(timestamp, since: datetime, width: int):
+    """
+    SQL bucket number of `timestamp` in `width`-second buckets from `since`.
+    """
+    return func.floor(
+        (func.unix_timestamp(timestamp) - func.unix_timestamp(since)) / width
+    )
+
+
+class TelemetryMetric(str, Enum):
+    voltage = "voltage"
+    current = "current"
+    temperature = "temperature"
+
+
+@router.get(
+    "/station/{station_id}/history",
+    dependencies=[Depends(require_role(UserRole.station_owner))]
+)
+async def get_station_telemetry_history(
+    station_id: int,
+    from_: datetime | None = Query(None, alias="from"),
+    to: datetime | None = Query(None),
+    cursor: str | None = Query(None),
+    limit: int = Query(1000, ge=1, le=10_000),
+    downsample: DownsampleMode = Query(DownsampleMode.none),
+    max_points: int = Query(500, ge=3, le=5_000),
+    metric: TelemetryMetric = Query(TelemetryMetric.temperature),
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """
+    Telemetry history for charts.
+
+    • downsample=none → raw rows, keyset-paged on (timestamp, id)
+    • downsample=lttb → at most max_points raw rows chosen by LTTB on `metric`,
+      from per-bucket min/max candidates preselected in SQL
+    • downsample=minmax → at most max_points buckets of min/max/avg, grouped in SQL
+    Defaults to the last 24 hours.
+    """
+    station = await station_cache.get(session, station_id)
 
     if not station or station.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    result = await session.execute(
-        select(StationTelemetry)
-        .where(StationTelemetry.station_id == station_id)
-        .order_by(desc(StationTelemetry.timestamp))
-        .limit(100)
+    until = as_naive_utc(to) if to else datetime.utcnow()
+    since = as_naive_utc(from_) if from_ else until - timedelta(hours=24)
+
+    if since >= until:
+        raise HTTPException(status_code=400, detail="'from' must be before 'to'")
+
+    telemetry = StationTelemetry
+    in_window = and_(
+        telemetry.station_id == station_id,
+        telemetry.timestamp >= since,
+        telemetry.timestamp < until,
     )
 
-    return result.scalars().all()
+    if downsample == DownsampleMode.minmax:
+        width = max(1, int((until - since).total_seconds() // max_points) + 1)
+        bucket = _time_bucket(telemetry.timestamp, since, width).label("bucket")
+
+        result = await session.execute(
+            select(
+                bucket,
+                func.count(),
+                func.min(telemetry.voltage),
+                func.max(telemetry.voltage),
+                func.avg(telemetry.voltage),
+                func.min(telemetry.current),
+                func.max(telemetry.current),
+                func.avg(telemetry.current),
+                func.min(telemetry.temperature),
+                func.max(telemetry.temperature),
+                func.avg(telemetry.temperature),
+            )
+            .where(in_window)
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+
+        return {
+            "mode": downsample,
+            "bucket_seconds": width,
+            "points": [
+                {
+                    "timestamp": since + timedelta(seconds=int(row[0]) * width),
+                    "count": row[1],
+                    "voltage": {"min": row[2], "max": row[3], "avg": row[4]},
+                    "current": {"min": row[5], "max": row[6], "avg": row[7]},
+                    "temperature": {"min": row[8], "max": row[9], "avg": row[10]},
+                }
+                for row in result.all()
+            ],
+            "next_cursor": None,
+        }
+
+    columns = (
+        telemetry.id,
+        telemetry.timestamp,
+        telemetry.voltage,
+        telemetry.current,
+        telemetry.temperature,
+    )
+    stmt = (
+        select(*columns)
+        .where(in_window)
+        .order_by(telemetry.timestamp, telemetry.id)
+    )
+
+    if downsample == DownsampleMode.lttb:
+        # Only the extremes of each candidate bucket leave the DB, so the
+        # rows loaded stay bounded by max_points whatever the window
+        buckets = max_points * LTTB_CANDIDATE_BUCKETS
+        width = max(1, int((until - since).total_seconds() // buckets) + 1)
+        bucket = _time_bucket(telemetry.timestamp, since, width)
+        value = getattr(telemetry, metric.value)
+
+        ranked = (
+            select(
+                *columns,
+                func.row_number()
+                .over(partition_by=bucket, order_by=(value, telemetry.id))
+                .label("low_rank"),
+                func.row_number()
+                .over(partition_by=bucket, order_by=(value.desc(), telemetry.id))
+                .label("high_rank"),
+            )
+            .where(in_window)
+            .subquery()
+        )
+        candidates = (
+            select(
+                ranked.c.id,
+                ranked.c.timestamp,
+                ranked.c.voltage,
+                ranked.c.current,
+                ranked.c.temperature,
+            )
+            .where(or_(ranked.c.low_rank == 1, ranked.c.high_rank == 1))
+            .order_by(ranked.c.timestamp, ranked.c.id)
+        )
+
+        rows = (await session.execute(candidates)).all()
+        if rows:
+            x = np.array([row[1] for row in rows], dtype="datetime64[us]").astype(np.int64)
+            y = np.array([getattr(row, metric.value) for row in rows], dtype=np.float64)
+            rows = [rows[i] for i in lttb(x.astype(np.float64), y, max_points).tolist()]
+        next_cursor = None
+
+    else:
+        if cursor:
+            last_timestamp, last_id = decode_cursor(cursor, 2)
+            stmt = stmt.where(
+                or_(
+                    telemetry.timestamp > last_timestamp,
+                    and_(
+                        telemetry.timestamp == last_timestamp,
+                        telemetry.id > last_id,
+                    ),
+                )
+            )
+
+        rows = (await session.execute(stmt.limit(limit + 1))).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].timestamp, rows[-1].id)
+
+    return {
+        "mode": downsample,
+        "points": [
+            {
+                "id": row.id,
+                "timestamp": row.timestamp,
+                "voltage": row.voltage,
+                "current": row.current,
+                "temperature": row.temperature,
+            }
+            for row in rows
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
+def _parse_ndjson(body: bytes, now: datetime) -> list[dict]:
+    rows = []
+
+    for line_no, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+
+        try:
+            reading = TelemetryIngest.model_validate_json(line)
+        except ValidationError as exc:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid reading on line {line_no}: {exc.errors()[0]['msg']}",
+            )
+
+        timestamp = as_naive_utc(reading.timestamp) if reading.timestamp else now
+
+        rows.append(
+            {
+                "station_id": reading.station_id,
+                "voltage": reading.voltage,
+                "current": reading.current,
+                "temperature": reading.temperature,
+                "timestamp": timestamp,
+            }
+        )
+
+    return rows
+
+
+def _parse_binary(body: bytes, now: datetime) -> list[dict]:
+    if len(body) % BINARY_READING.itemsize:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Binary body must be a multiple of {BINARY_READING.itemsize} bytes",
+        )
+
+    records = np.frombuffer(body, dtype=BINARY_READING)
+
+    if (records["station_id"] <= 0).any():
+        raise HTTPException(status_code=422, detail="Invalid station_id")
+
+    # MySQL cannot store NaN / ±inf
+    finite = (
+        np.isfinite(records["voltage"])
+        & np.isfinite(records["current"])
+        & np.isfinite(records["temperature"])
+        & np.isfinite(records["timestamp"])
+    )
+    if not finite.all():
+        raise HTTPException(status_code=422, detail="Readings must be finite numbers")
+
+    seconds = records["timestamp"]
+    micros = np.round(seconds * 1_000_000).astype(np.int64)
+    timestamps = micros.astype("datetime64[us]").tolist()
+
+    return [
+        {
+            "station_id": station_id,
+            "voltage": voltage,
+            "current": current,
+            "temperature": temperature,
+            "timestamp": timestamp if sent else now,
+        }
+        for station_id, voltage, current, temperature, timestamp, sent in zip(
+            records["station_id"].tolist(),
+            records["voltage"].tolist(),
+            records["current"].tolist(),
+            records["temperature"].tolist(),
+            timestamps,
+            (seconds > 0).tolist(),
+        )
+    ]
+
+
+@router.post(
+    "/ingest",
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(require_role(UserRole.station_owner, UserRole.admin))],
+)
+async def ingest_telemetry(
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
+    current_user=Depends(get_current_user),
+):
+    """
+    Batch ingestion for real chargers.
+
+    Body formats (by Content-Type):
+    • application/x-ndjson → one TelemetryIngest JSON object per line
+    • application/octet-stream → packed BINARY_READING records
+
+    Accepted readings go to the write-behind buffer, so the response
+    does not wait for a MySQL commit. 429 signals a full buffer; 422
+    a timestamp outside retention or too far in the future.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    body = await request.body()
+    now = datetime.utcnow()
+
+    if content_type in ("application/x-ndjson", "application/ndjson"):
+        rows = _parse_ndjson(body, now)
+    elif content_type == "application/octet-stream":
+        rows = _parse_binary(body, now)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Use application/x-ndjson or application/octet-stream",
+        )
+
+    if not rows:
+        return {"accepted": 0}
+
+    if len(rows) > settings.TELEMETRY_INGEST_MAX_READINGS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.TELEMETRY_INGEST_MAX_READINGS} readings per request",
+        )
+
+    # Older than retention has no partition left; far-future readings
+    # would pile up in pmax and pose as the latest value
+    oldest = now - timedelta(days=settings.TELEMETRY_RETENTION_DAYS)
+    newest = now + timedelta(seconds=settings.TELEMETRY_MAX_CLOCK_SKEW_SECONDS)
+    if any(not oldest <= row["timestamp"] <= newest for row in rows):
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"Reading timestamps must be within the last "
+                f"{settings.TELEMETRY_RETENTION_DAYS} days and at most "
+                f"{settings.TELEMETRY_MAX_CLOCK_SKEW_SECONDS}s ahead of server time"
+            ),
+        )
+
+    # Unknown stations would be orphaned rows, reject early
+    station_ids = {row["station_id"] for row in rows}
+    stations = await station_cache.get_many(session, station_ids)
+
+    if len(stations) != len(station_ids):
+        raise HTTPException(status_code=404, detail="Station not found")
+
+    if current_user.role == UserRole.station_owner and any(
+        station.owner_id != current_user.id for station in stations.values()
+    ):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    if not telemetry_buffer.offer(rows):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Telemetry buffer full, retry later",
+            headers={"Retry-After": str(max(1, int(settings.TELEMETRY_BUFFER_FLUSH_SECONDS)))},
+        )
+
+    return {"accepted": len(rows)}
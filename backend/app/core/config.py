@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -18,6 +20,73 @@ class Settings(BaseSettings):
 
     MODEL_PATH: str = "app/services/model.pkl"
 
+    # Telemetry ingestion (write-behind buffer)
+    TELEMETRY_BUFFER_MAX_ROWS: int = 100_000
+    TELEMETRY_BUFFER_FLUSH_ROWS: int = 5_000
+    TELEMETRY_BUFFER_FLUSH_SECONDS: float = 1.0
+    TELEMETRY_INGEST_MAX_READINGS: int = 10_000
+    # Accepted reading timestamps: [now - retention, now + skew]
+    TELEMETRY_MAX_CLOCK_SKEW_SECONDS: int = 300
+
+    # Readings kept per station in the in-memory ring buffer
+    TELEMETRY_RING_SIZE: int = 100
+    # Warm rings are reseeded from the DB after this (other workers' writes)
+    TELEMETRY_RING_TTL_SECONDS: float = 30.0
+
+    # Incremental 1m / 1h telemetry rollups
+    TELEMETRY_ROLLUP_INTERVAL_SECONDS: int = 60
+    TELEMETRY_ROLLUP_BATCH_ROWS: int = 1_000_000
+    TELEMETRY_ROLLUP_MAX_BATCHES: int = 5
+    # Upper bound on how long a telemetry write transaction stays open
+    TELEMETRY_ROLLUP_COMMIT_LAG_SECONDS: int = 30
+
+    # Daily partitions of station_telemetry
+    TELEMETRY_RETENTION_DAYS: int = 30
+    TELEMETRY_PARTITIONS_AHEAD: int = 7
+
+    # Driver map engine: MySQL spatial query or in-memory grid index
+    STATION_MAP_ENGINE: Literal["mysql", "memory"] = "mysql"
+
+    # Clustered map tiles
+    MAP_TILE_CACHE_SIZE: int = 4096
+    MAP_TILE_CACHE_TTL_SECONDS: int = 30
+    # Zooms up to this one span whole regions: not invalidated per
+    # booking / status change, refreshed only after the longer TTL
+    MAP_TILE_OVERVIEW_MAX_ZOOM: int = 7
+    MAP_TILE_OVERVIEW_TTL_SECONDS: int = 300
+
+    # Station catalog (id → snapshot) cache
+    STATION_CACHE_SIZE: int = 50_000
+    STATION_CACHE_TTL_SECONDS: int = 60
+
+    # Booking writes
+    BOOKING_MAX_HOURS: int = 24
+    BOOKING_DEADLOCK_RETRIES: int = 2
+    BOOKING_BULK_MAX_WINDOWS: int = 500
+    # Longest span of a station's schedule one bulk transaction locks
+    BOOKING_BULK_LOCK_HOURS: int = 168
+
+    # Completes confirmed bookings whose end_time has passed
+    BOOKING_LIFECYCLE_INTERVAL_SECONDS: int = 60
+    BOOKING_LIFECYCLE_CHUNK_ROWS: int = 1_000
+    BOOKING_LIFECYCLE_MAX_CHUNKS: int = 20
+
+    # Analytics / owner revenue response cache
+    ANALYTICS_CACHE_SIZE: int = 2_048
+    ANALYTICS_CACHE_TTL_SECONDS: int = 30
+    # Longest [from, to) answered from raw bookings (non-UTC / hourly)
+    ANALYTICS_RAW_MAX_DAYS: int = 92
+
+    # Streaming CSV / NDJSON exports (rows per server-side fetch)
+    EXPORT_CHUNK_ROWS: int = 2_000
+    # Longest telemetry export across all of a caller's stations;
+    # longer ranges need station_id
+    EXPORT_TELEMETRY_MAX_DAYS: int = 7
+
+    # Per-station interval index of confirmed bookings
+    BOOKING_INDEX_SIZE: int = 10_000
+    BOOKING_INDEX_TTL_SECONDS: int = 30
+
     model_config = {
         "env_file": ".env",
         "case_sensitive": True,
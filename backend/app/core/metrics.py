@@ -0,0 +1,37 @@
+from collections import defaultdict
+from typing import Callable
+
+
+class MetricsRegistry:
+    """
+    Process-local counters and gauges, exposed at GET /admin/metrics.
+
+    • Counters only go up (totals since process start)
+    • Gauges hold the last reported value
+    • Collectors are called at read time for values owned elsewhere
+      (e.g. cache sizes)
+    """
+
+    def __init__(self):
+        self._counters: dict[str, float] = defaultdict(float)
+        self._gauges: dict[str, float] = {}
+        self._collectors: dict[str, Callable[[], dict]] = {}
+
+    def incr(self, name: str, value: float = 1):
+        self._counters[name] += value
+
+    def set(self, name: str, value: float):
+        self._gauges[name] = value
+
+    def register(self, name: str, collector: Callable[[], dict]):
+        self._collectors[name] = collector
+
+    def snapshot(self) -> dict:
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            **{name: collect() for name, collect in self._collectors.items()},
+        }
+
+
+metrics = MetricsRegistry()
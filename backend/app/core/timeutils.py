@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+
+
+def as_naive_utc(value: datetime) -> datetime:
+    """
+    Timestamps are stored as naive UTC (MySQL DATETIME).
+    Aware inputs are converted; naive ones are assumed UTC already.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -5,6 +5,11 @@ from app.services.ai_singleton import ai_service
 from app.core.config import settings
 from app.db.session import AsyncSessionLocal
 from app.services.simulator import IoTSimulatorService
+from app.services.booking_lifecycle import BookingLifecycleService
+from app.services.telemetry_buffer import telemetry_buffer
+from app.services.station_geo_index import station_geo_index
+from app.services.telemetry_rollup import TelemetryRollupService
+from app.services.telemetry_partitions import TelemetryPartitionService
 from app.websockets.owner import owner_telemetry_ws
 from app.websockets.admin import admin_alert_ws
 from app.api.v1.endpoints import (
@@ -21,11 +26,15 @@ from app.api.v1.endpoints import (
     analytics,
     admin,
     notifications,
+    exports,
 )
 
 
 # Global service instance
 iot_simulator = IoTSimulatorService(AsyncSessionLocal)
+telemetry_rollup = TelemetryRollupService(AsyncSessionLocal)
+telemetry_partitions = TelemetryPartitionService(AsyncSessionLocal)
+booking_lifecycle = BookingLifecycleService(AsyncSessionLocal)
 
 
 @asynccontextmanager
@@ -43,12 +52,31 @@ async def lifespan(app: FastAPI):
     except Exception:
         ai_service.train_and_save_dummy_model()
 
+    # Build in-memory spatial index of active stations
+    async with AsyncSessionLocal() as session:
+        await station_geo_index.rebuild(session)
+
     # Start background IoT simulator
     iot_simulator.start()
 
+    # Start incremental telemetry downsampling
+    telemetry_rollup.start()
+
+    # Start telemetry partition rotation (retention)
+    telemetry_partitions.start()
+
+    # Complete bookings whose end_time has passed
+    booking_lifecycle.start()
+
+    # Start write-behind flusher for ingested telemetry
+    telemetry_buffer.start()
+
     yield
 
     # ---- SHUTDOWN ----
+    # Persist readings still sitting in the write-behind buffer
+    await telemetry_buffer.stop()
+
     # APScheduler shuts down automatically with event loop
     # No explicit DB cleanup required (sessions are scoped per request)
 
@@ -75,6 +103,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Content-Disposition"],
 )
 
 # -------------------------
@@ -93,6 +122,7 @@ app.include_router(chargers.router, prefix="/api/v1")
 app.include_router(analytics.router, prefix="/api/v1")
 app.include_router(admin.router, prefix="/api/v1")
 app.include_router(notifications.router, prefix="/api/v1")
+app.include_router(exports.router, prefix="/api/v1")
 
 @app.websocket("/ws/owner/telemetry")
 async def owner_ws(websocket: WebSocket):
@@ -1,5 +1,5 @@
 import enum
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, List
 
 from sqlalchemy import (
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Integer,
     BigInteger,
     Float,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
@@ -172,8 +173,12 @@ class Station(Base):
         back_populates="station"
     )
 
+    # No FK on partitioned station_telemetry, so the join is explicit;
+    # raw rows of a deleted station are left to partition retention
     telemetry: Mapped[List["StationTelemetry"]] = relationship(
-        back_populates="station"
+        primaryjoin="Station.id == foreign(StationTelemetry.station_id)",
+        back_populates="station",
+        passive_deletes="all",
     )
 
     # 🔑 THIS IS THE FIX
@@ -252,6 +257,18 @@ class Booking(Base):
             "start_time",
             "end_time",
         ),
+        Index(
+            "idx_booking_user_start",
+            "user_id",
+            "start_time",
+        ),
+        Index(
+            "idx_booking_station_status_end",
+            "station_id",
+            "status",
+            "end_time",
+            "total_cost",
+        ),
     )
 
 
@@ -260,6 +277,13 @@ class Booking(Base):
 # -------------------------
 
 class StationTelemetry(Base):
+    """
+    Raw readings, RANGE-partitioned by day on timestamp (see
+    services/telemetry_partitions.py). InnoDB partitioned tables allow
+    no foreign keys and need the partitioning column in every unique
+    key, hence the plain station_id and the (id, timestamp) PK.
+    """
+
     __tablename__ = "station_telemetry"
 
     id: Mapped[int] = mapped_column(
@@ -270,7 +294,6 @@ class StationTelemetry(Base):
 
     station_id: Mapped[int] = mapped_column(
         BigInteger,
-        ForeignKey("stations.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
@@ -292,6 +315,7 @@ class StationTelemetry(Base):
 
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
         nullable=False,
         index=True,
@@ -299,5 +323,124 @@ class StationTelemetry(Base):
 
     # Relationships
     station: Mapped["Station"] = relationship(
-        back_populates="telemetry"
+        primaryjoin="foreign(StationTelemetry.station_id) == Station.id",
+        back_populates="telemetry",
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_telemetry_station_time",
+            "station_id",
+            "timestamp",
+        ),
+    )
+
+
+# -------------------------
+# TELEMETRY ROLLUP TABLES
+# -------------------------
+
+class TelemetryRollupMixin:
+    """
+    Shared columns of the 1-minute and 1-hour rollups.
+    One row per station per bucket; averages are sample-weighted.
+    """
+
+    station_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("stations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+    )
+
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    voltage_min: Mapped[float] = mapped_column(Float, nullable=False)
+    voltage_max: Mapped[float] = mapped_column(Float, nullable=False)
+    voltage_avg: Mapped[float] = mapped_column(Float, nullable=False)
+
+    current_min: Mapped[float] = mapped_column(Float, nullable=False)
+    current_max: Mapped[float] = mapped_column(Float, nullable=False)
+    current_avg: Mapped[float] = mapped_column(Float, nullable=False)
+
+    temperature_min: Mapped[float] = mapped_column(Float, nullable=False)
+    temperature_max: Mapped[float] = mapped_column(Float, nullable=False)
+    temperature_avg: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # Readings with temperature > 80 (same rule as charger status)
+    fault_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class StationTelemetryMinute(TelemetryRollupMixin, Base):
+    __tablename__ = "station_telemetry_1m"
+
+    __table_args__ = (
+        Index("idx_telemetry_1m_bucket", "bucket_start"),
+    )
+
+
+class StationTelemetryHour(TelemetryRollupMixin, Base):
+    __tablename__ = "station_telemetry_1h"
+
+    __table_args__ = (
+        Index("idx_telemetry_1h_bucket", "bucket_start"),
+    )
+
+
+class TelemetryRollupState(Base):
+    """
+    Incremental rollup watermark (last raw telemetry id processed)
+    and the time coverage it implies: every raw row with a timestamp
+    before covered_until is already in the rollups.
+    """
+
+    __tablename__ = "telemetry_rollup_state"
+
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+
+    last_id: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
+
+    covered_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+
+# -------------------------
+# BOOKING AGGREGATES
+# -------------------------
+
+class StationDailyStats(Base):
+    """
+    Per-station, per-day booking aggregates, maintained incrementally
+    on completion / cancellation (see services/daily_stats.py).
+
+    • completed_bookings, cancelled_bookings: by start_time day
+    • revenue: completed bookings' total_cost, by end_time day
+    """
+
+    __tablename__ = "station_daily_stats"
+
+    station_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("stations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    completed_bookings: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cancelled_bookings: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        Index("idx_daily_stats_day", "day"),
     )
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field, model_validator
-from datetime import datetime
+from pydantic import BaseModel, Field, field_validator, model_validator
+from datetime import datetime, timedelta
 from enum import Enum
+from typing import Literal
+
+from ..core.config import settings
 
 
 class BookingStatus(str, Enum):
@@ -9,18 +12,91 @@ class BookingStatus(str, Enum):
     completed = "completed"
 
 
-class BookingCreate(BaseModel):
-    station_id: int
+class BookingWindow(BaseModel):
     start_time: datetime
     end_time: datetime
 
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def truncate_to_seconds(cls, value: datetime) -> datetime:
+        # bookings.*_time are DATETIME(0): MySQL would round fractions,
+        # so checks and responses would disagree with the stored row
+        return value.replace(microsecond=0)
+
     @model_validator(mode="after")
     def validate_time_window(self):
         if self.end_time <= self.start_time:
             raise ValueError("end_time must be after start_time")
+        if (self.end_time - self.start_time).total_seconds() > settings.BOOKING_MAX_HOURS * 3600:
+            raise ValueError(
+                f"Bookings cannot exceed {settings.BOOKING_MAX_HOURS} hours"
+            )
         return self
 
 
+class BookingCreate(BookingWindow):
+    station_id: int
+
+
+class BookingRecurrence(BookingWindow):
+    """
+    First occurrence plus a repeat rule, e.g. daily × 30.
+    """
+
+    frequency: Literal["daily", "weekly"]
+    count: int = Field(gt=0, le=settings.BOOKING_BULK_MAX_WINDOWS)
+
+    def expand(self) -> list[BookingWindow]:
+        step = timedelta(days=1 if self.frequency == "daily" else 7)
+        return [
+            BookingWindow(
+                start_time=self.start_time + i * step,
+                end_time=self.end_time + i * step,
+            )
+            for i in range(self.count)
+        ]
+
+
+class BookingBulkCreate(BaseModel):
+    """
+    Either an explicit list of windows or a recurrence rule.
+    """
+
+    station_id: int
+    windows: list[BookingWindow] | None = Field(None, min_length=1)
+    recurrence: BookingRecurrence | None = None
+
+    @model_validator(mode="after")
+    def validate_source(self):
+        if (self.windows is None) == (self.recurrence is None):
+            raise ValueError("Provide exactly one of windows or recurrence")
+        if len(self.requested_windows()) > settings.BOOKING_BULK_MAX_WINDOWS:
+            raise ValueError(
+                f"At most {settings.BOOKING_BULK_MAX_WINDOWS} windows per request"
+            )
+        return self
+
+    def requested_windows(self) -> list[BookingWindow]:
+        if self.windows is not None:
+            return self.windows
+        return self.recurrence.expand()
+
+
+class BookingBulkItem(BaseModel):
+    start_time: datetime
+    end_time: datetime
+    status: Literal["created", "conflict"]
+    booking_id: int | None = None
+    detail: str | None = None
+
+
+class BookingBulkRead(BaseModel):
+    station_id: int
+    created: int
+    conflicts: int
+    results: list[BookingBulkItem]
+
+
 class BookingRead(BaseModel):
     id: int
     user_id: int
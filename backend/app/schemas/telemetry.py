@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 
@@ -13,3 +13,12 @@ class TelemetryRead(BaseModel):
     model_config = {
         "from_attributes": True
     }
+
+
+class TelemetryIngest(BaseModel):
+    station_id: int = Field(gt=0)
+    # MySQL cannot store NaN / ±inf
+    voltage: float = Field(allow_inf_nan=False)
+    current: float = Field(allow_inf_nan=False)
+    temperature: float = Field(allow_inf_nan=False)
+    timestamp: datetime | None = None
@@ -1,11 +1,16 @@
 import numpy as np
 import joblib
 from sklearn.ensemble import IsolationForest
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.models import StationTelemetry
 from ..core.config import settings
+from ..services.telemetry_ring import telemetry_ring, to_epoch
+
+
+# Telemetry rows scored per station
+WINDOW_SIZE = 50
 
 
 class AIAnomalyService:
@@ -33,37 +38,118 @@ class AIAnomalyService:
         """
         self.model = joblib.load(settings.MODEL_PATH)
 
+    @staticmethod
+    def _summarize(anomalies: int):
+        return {
+            "health_score": max(0, 100 - anomalies * 2),
+            "risk_level": "HIGH" if anomalies > 3 else "LOW",
+            "anomalies_detected": anomalies,
+        }
+
+    async def _load_windows(self, session: AsyncSession, station_ids):
+        """
+        Cold path: one windowed query fetching a full ring's worth of
+        rows per station. Seeds the ring buffers and returns the
+        newest WINDOW_SIZE readings as (owners, values).
+        """
+        depth = telemetry_ring.capacity
+
+        ranked = (
+            select(
+                StationTelemetry.station_id,
+                StationTelemetry.voltage,
+                StationTelemetry.current,
+                StationTelemetry.temperature,
+                StationTelemetry.timestamp,
+                func.row_number()
+                .over(
+                    partition_by=StationTelemetry.station_id,
+                    order_by=desc(StationTelemetry.timestamp),
+                )
+                .label("rn"),
+            )
+            .where(StationTelemetry.station_id.in_(station_ids))
+            .subquery()
+        )
+
+        rows = (
+            await session.execute(
+                select(
+                    ranked.c.station_id,
+                    ranked.c.voltage,
+                    ranked.c.current,
+                    ranked.c.temperature,
+                    ranked.c.timestamp,
+                    ranked.c.rn,
+                )
+                .where(ranked.c.rn <= depth)
+                .order_by(ranked.c.station_id, ranked.c.rn)
+            )
+        ).all()
+
+        owners = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+        values = np.array([r[1:4] for r in rows], dtype=np.float64).reshape(-1, 3)
+        timestamps = to_epoch([r[4] for r in rows])
+        ranks = np.fromiter((r[5] for r in rows), dtype=np.int64, count=len(rows))
+
+        # Rows are grouped by station, newest first within each group
+        boundaries = np.flatnonzero(np.diff(owners)) + 1
+        seeded = set()
+        for group in np.split(np.arange(len(rows)), boundaries):
+            if len(group):
+                station_id = int(owners[group[0]])
+                telemetry_ring.seed(station_id, values[group], timestamps[group])
+                seeded.add(station_id)
+
+        # Stations without any telemetry are warm (and empty) too
+        for station_id in station_ids:
+            if station_id not in seeded:
+                telemetry_ring.seed(station_id, np.empty((0, 3)), np.empty(0))
+
+        scored = ranks <= WINDOW_SIZE
+        return owners[scored], values[scored]
+
     async def analyze_station(self, session: AsyncSession, station_id: int):
         """
-        Fetches last 50 telemetry rows and runs inference.
-        Async because DB read is network I/O.
+        Scores the last 50 telemetry readings.
+        Served from the ring buffer; the DB is only read on a cold start.
+        """
+        return (await self.analyze_stations(session, [station_id]))[station_id]
+
+    async def analyze_stations(self, session: AsyncSession, station_ids):
+        """
+        Fleet-wide variant of analyze_station.
+
+        • Warm stations are read from the in-memory ring buffers
+        • Cold stations share one windowed query
+        • One vectorized predict() call scores every row
+        Returns {station_id: result} in the analyze_station shape.
         """
         if self.model is None:
             raise RuntimeError("AI model not loaded")
 
-        result = await session.execute(
-            select(StationTelemetry)
-            .where(StationTelemetry.station_id == station_id)
-            .order_by(desc(StationTelemetry.timestamp))
-            .limit(50)
-        )
-        rows = result.scalars().all()
+        station_ids = list(dict.fromkeys(station_ids))
+        results = {sid: self._summarize(0) for sid in station_ids}
 
-        if not rows:
-            return {
-                "health_score": 100,
-                "risk_level": "LOW",
-                "anomalies_detected": 0,
-            }
+        if not station_ids:
+            return results
 
-        data = np.array([[r.voltage, r.current, r.temperature] for r in rows])
-        predictions = self.model.predict(data)  # -1 = anomaly
+        owners, values, missing = telemetry_ring.windows(station_ids, WINDOW_SIZE)
 
-        anomalies = int((predictions == -1).sum())
-        health_score = max(0, 100 - anomalies * 2)
+        if missing:
+            cold_owners, cold_values = await self._load_windows(session, missing)
+            owners = np.concatenate([owners, cold_owners])
+            values = np.concatenate([values, cold_values])
 
-        return {
-            "health_score": health_score,
-            "risk_level": "HIGH" if anomalies > 3 else "LOW",
-            "anomalies_detected": anomalies,
-        }
+        if not len(owners):
+            return results
+
+        predictions = self.model.predict(values)  # -1 = anomaly
+
+        # Count anomalies per station without a Python loop over rows
+        flagged, counts = np.unique(owners[predictions == -1], return_counts=True)
+
+        for station_id, anomalies in zip(flagged.tolist(), counts.tolist()):
+            results[station_id] = self._summarize(int(anomalies))
+
+        return results
@@ -0,0 +1,73 @@
+import json
+from collections import defaultdict
+from typing import Any, Hashable
+
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..models.models import UserRole
+
+ADMIN_SCOPE = "admin"
+
+
+class AnalyticsCache:
+    """
+    Process-wide cache of analytics / revenue responses.
+
+    • Keyed by (scope, generation, endpoint, params); scope is the owner
+      id, or "admin" for cross-owner views
+    • invalidate_owner() bumps the owner's and the admin generation, so
+      every affected entry becomes unreachable in O(1); stale entries
+      age out through LRU eviction / TTL
+    • get() also returns the full key for the current generation and
+      set() stores under that key, so a result computed while an
+      invalidation ran is written to the already-dead generation
+    • TTL also bounds staleness for time-relative results (this week)
+      and for writes made by other processes
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations: dict[Hashable, int] = defaultdict(int)
+
+    def _key(self, scope: Hashable, key: tuple) -> tuple:
+        return (scope, self._generations[scope], *key)
+
+    def get(self, scope: Hashable, key: tuple) -> tuple[Any | None, tuple]:
+        """
+        Returns (cached value or None, full key to pass to set()).
+        """
+        full_key = self._key(scope, key)
+        entry = self._cache.get(full_key)
+        return (None if entry is None else entry[0]), full_key
+
+    def set(self, full_key: tuple, value: Any):
+        # Approximate footprint: size of the serialized response
+        size = len(json.dumps(value, default=str))
+        self._cache.set(full_key, (value, size))
+
+    def invalidate_owner(self, owner_id: int):
+        self._generations[owner_id] += 1
+        self._generations[ADMIN_SCOPE] += 1
+
+    def stats(self) -> dict:
+        return {
+            **self._cache.stats(),
+            "approx_bytes": sum(size for _, size in self._cache.values()),
+        }
+
+
+def cache_scope(current_user) -> Hashable:
+    """
+    Owners get their own scope; admins share one.
+    """
+    if current_user.role == UserRole.station_owner:
+        return current_user.id
+    return ADMIN_SCOPE
+
+
+analytics_cache = AnalyticsCache(
+    maxsize=settings.ANALYTICS_CACHE_SIZE,
+    ttl=settings.ANALYTICS_CACHE_TTL_SECONDS,
+)
+metrics.register("analytics_cache", analytics_cache.stats)
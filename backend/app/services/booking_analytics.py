@@ -0,0 +1,158 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Literal
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..models.models import Booking, BookingStatus, Station, StationDailyStats
+
+Granularity = Literal["hour", "day", "week", "month"]
+Metric = Literal["usage", "revenue"]
+
+# metric → (aggregate column, raw timestamp column it is bucketed by)
+METRICS = {
+    "usage": (StationDailyStats.completed_bookings, Booking.start_time),
+    "revenue": (StationDailyStats.revenue, Booking.end_time),
+}
+
+UTC = ZoneInfo("UTC")
+
+
+def parse_zone(tz: str) -> ZoneInfo:
+    try:
+        return ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail=f"Unknown time zone: {tz}")
+
+
+def to_utc(value: datetime | None, zone: ZoneInfo) -> datetime | None:
+    """
+    Query bound → naive UTC; naive inputs are read as local time in `zone`.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=zone)
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _bucket(local: datetime | date, granularity: Granularity):
+    if granularity == "hour":
+        return local.replace(minute=0, second=0, microsecond=0)
+
+    day = local.date() if isinstance(local, datetime) else local
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _floor_day(value: datetime) -> datetime:
+    return datetime.combine(value.date(), time(0))
+
+
+def _ceil_day(value: datetime) -> datetime:
+    floored = _floor_day(value)
+    return floored if floored == value else floored + timedelta(days=1)
+
+
+async def booking_series(
+    session: AsyncSession,
+    *,
+    metric: Metric,
+    owner_id: int | None,
+    since: datetime | None,
+    until: datetime | None,
+    zone: ZoneInfo,
+    granularity: Granularity,
+) -> list[tuple[datetime | date, float]]:
+    """
+    Completed-booking usage or revenue, bucketed in `zone`.
+
+    since / until are naive UTC, [since, until); None means unbounded.
+
+    • UTC, ≥ day buckets → whole days from station_daily_stats (rolled
+      up to week / month afterwards), partial edge days from raw rows
+    • Otherwise → range predicate on the raw timestamp column
+      (index-friendly, no DATE() wrapper), bucketed in Python; needs
+      both bounds, at most ANALYTICS_RAW_MAX_DAYS apart
+    """
+    stats_column, time_column = METRICS[metric]
+    totals = defaultdict(float)
+
+    async def add_stats(first_day: datetime | None, end_day: datetime | None):
+        stats = StationDailyStats
+        stmt = select(stats.day, func.sum(stats_column)).group_by(stats.day)
+
+        if owner_id is not None:
+            stmt = stmt.join(Station, stats.station_id == Station.id).where(
+                Station.owner_id == owner_id
+            )
+        if first_day is not None:
+            stmt = stmt.where(stats.day >= first_day.date())
+        if end_day is not None:
+            stmt = stmt.where(stats.day < end_day.date())
+
+        for day, value in (await session.execute(stmt)).all():
+            totals[_bucket(day, granularity)] += value or 0
+
+    async def add_raw(start: datetime, end: datetime):
+        value = func.count() if metric == "usage" else func.sum(Booking.total_cost)
+
+        # Exact timestamps are needed for local bucketing, but identical
+        # ones (e.g. on-the-hour slots) collapse in SQL
+        stmt = (
+            select(time_column, value)
+            .where(
+                Booking.status == BookingStatus.completed,
+                time_column >= start,
+                time_column < end,
+            )
+            .group_by(time_column)
+        )
+
+        if owner_id is not None:
+            stmt = stmt.join(Station, Booking.station_id == Station.id).where(
+                Station.owner_id == owner_id
+            )
+
+        for moment, amount in (await session.execute(stmt)).all():
+            local = moment.replace(tzinfo=timezone.utc).astimezone(zone)
+            totals[_bucket(local, granularity)] += amount or 0
+
+    if zone.key == "UTC" and granularity != "hour":
+        head = _ceil_day(since) if since is not None else None
+        tail = _floor_day(until) if until is not None else None
+
+        if head is not None and tail is not None and head >= tail:
+            # Less than one whole day: raw only
+            await add_raw(since, until)
+        else:
+            await add_stats(head, tail)
+            if since is not None and since < head:
+                await add_raw(since, head)
+            if until is not None and tail < until:
+                await add_raw(tail, until)
+
+    else:
+        max_span = timedelta(days=settings.ANALYTICS_RAW_MAX_DAYS)
+        if since is None or until is None or until - since > max_span:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    "Non-UTC or hourly analytics need 'from' and 'to' at most "
+                    f"{settings.ANALYTICS_RAW_MAX_DAYS} days apart"
+                ),
+            )
+        await add_raw(since, until)
+
+    return [
+        (bucket, amount)
+        for bucket, amount in sorted(totals.items())
+        if amount
+    ]
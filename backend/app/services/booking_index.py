@@ -0,0 +1,177 @@
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..core.timeutils import as_naive_utc
+from ..models.models import Booking, BookingStatus
+
+
+class StationIntervals:
+    """
+    Confirmed bookings of one station as parallel arrays sorted by start.
+
+    Confirmed bookings never overlap, so ends are sorted as well and the
+    only candidate conflict for [start, end) is the last interval that
+    starts before `end`. Only upcoming bookings of one station are held,
+    so add()'s list.insert shifts tens to a few thousand pointers.
+    """
+
+    __slots__ = ("starts", "ends", "ids")
+
+    def __init__(self):
+        self.starts: list[datetime] = []
+        self.ends: list[datetime] = []
+        self.ids: list[int] = []
+
+    def add(self, booking_id: int, start: datetime, end: datetime):
+        i = bisect_left(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.ids.insert(i, booking_id)
+
+    def remove(self, booking_id: int, start: datetime):
+        i = bisect_left(self.starts, start)
+        while i < len(self.starts) and self.starts[i] == start:
+            if self.ids[i] == booking_id:
+                del self.starts[i]
+                del self.ends[i]
+                del self.ids[i]
+                return
+            i += 1
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        i = bisect_left(self.starts, end)
+        return i > 0 and self.ends[i - 1] > start
+
+
+class BookingIntervalIndex:
+    """
+    Process-wide per-station index of upcoming confirmed bookings.
+
+    • Loaded lazily per station (one range read), reloaded after the TTL
+      so bookings written by other processes become visible
+    • Kept current in this process by add() / remove() on create & cancel
+    • Every change bumps the station's generation; a read only caches
+      its result if the generation did not move while it ran, so a load
+      racing a commit never caches intervals without that booking
+    • Advisory only: a hit lets callers reject early, a miss still goes
+      through the conditional INSERT's database overlap check
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._stations = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations: dict[int, int] = defaultdict(int)
+
+    async def load(self, session: AsyncSession, station_id: int) -> StationIntervals:
+        intervals = self._stations.get(station_id)
+        if intervals is not None:
+            return intervals
+
+        generation = self.generation(station_id)
+        rows = await session.execute(
+            select(Booking.id, Booking.start_time, Booking.end_time)
+            .where(
+                Booking.station_id == station_id,
+                Booking.status == BookingStatus.confirmed,
+                Booking.end_time > datetime.utcnow(),
+            )
+            .order_by(Booking.start_time)
+        )
+
+        intervals = StationIntervals()
+        for booking_id, start, end in rows.all():
+            intervals.ids.append(booking_id)
+            intervals.starts.append(as_naive_utc(start))
+            intervals.ends.append(as_naive_utc(end))
+
+        self.store(station_id, intervals, generation)
+        return intervals
+
+    def peek(self, station_id: int) -> StationIntervals | None:
+        """
+        Cached intervals or None; never reads the database.
+        """
+        return self._stations.get(station_id)
+
+    def generation(self, station_id: int) -> int:
+        """
+        Read before querying; pass the value to store().
+        """
+        return self._generations[station_id]
+
+    def store(self, station_id: int, intervals: StationIntervals, generation: int):
+        """
+        Caches intervals read by a caller's own (combined) query, unless
+        the station changed since `generation` was taken.
+        """
+        if self._generations[station_id] == generation:
+            self._stations.set(station_id, intervals)
+
+    async def is_free(
+        self,
+        session: AsyncSession,
+        station_id: int,
+        start: datetime,
+        end: datetime,
+    ) -> bool:
+        """
+        True when no confirmed booking overlaps [start, end), per MySQL.
+
+        Answered by a probe bounded below by BOOKING_MAX_HOURS (a short
+        range scan on idx_booking_station_time). A cached entry that
+        disagrees with it, e.g. after a write by another process, is
+        dropped so the next reader loads it fresh.
+        """
+        start, end = as_naive_utc(start), as_naive_utc(end)
+
+        taken = (
+            await session.execute(
+                select(Booking.id)
+                .where(
+                    Booking.station_id == station_id,
+                    Booking.status == BookingStatus.confirmed,
+                    Booking.start_time > start - timedelta(hours=settings.BOOKING_MAX_HOURS),
+                    Booking.start_time < end,
+                    Booking.end_time > start,
+                )
+                .limit(1)
+            )
+        ).first() is not None
+
+        intervals = self._stations.get(station_id)
+        if intervals is not None and intervals.overlaps(start, end) != taken:
+            self.invalidate(station_id)
+
+        return not taken
+
+    def add(self, station_id: int, booking_id: int, start: datetime, end: datetime):
+        self._generations[station_id] += 1
+        intervals = self._stations.get(station_id)
+        if intervals is not None:
+            intervals.add(booking_id, as_naive_utc(start), as_naive_utc(end))
+
+    def remove(self, station_id: int, booking_id: int, start: datetime):
+        self._generations[station_id] += 1
+        intervals = self._stations.get(station_id)
+        if intervals is not None:
+            intervals.remove(booking_id, as_naive_utc(start))
+
+    def invalidate(self, station_id: int):
+        self._generations[station_id] += 1
+        self._stations.pop(station_id)
+
+    def stats(self) -> dict:
+        return self._stations.stats()
+
+
+booking_index = BookingIntervalIndex(
+    maxsize=settings.BOOKING_INDEX_SIZE,
+    ttl=settings.BOOKING_INDEX_TTL_SECONDS,
+)
+metrics.register("booking_index", booking_index.stats)
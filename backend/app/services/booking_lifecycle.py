@@ -0,0 +1,113 @@
+import time
+from datetime import datetime
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..models.models import Booking, BookingStatus
+from .analytics_cache import analytics_cache
+from .daily_stats import record_completed, stats_lock
+from .station_cache import station_cache
+
+
+class BookingLifecycleService:
+    def __init__(self, db_session_factory):
+        """
+        db_session_factory: callable returning AsyncSession
+        Moves confirmed bookings whose end_time has passed to completed.
+        """
+        self.db_session_factory = db_session_factory
+        self.scheduler = AsyncIOScheduler()
+
+    async def _complete_chunk(self, session: AsyncSession, now: datetime) -> int:
+        """
+        One chunk: lock due rows (skipping ones a cancel is holding),
+        flip them, and fold them into station_daily_stats, all in one
+        transaction. Locked rows are still confirmed, so re-runs and
+        overlapping ticks never double count.
+        """
+        due = (
+            await session.execute(
+                select(
+                    Booking.id,
+                    Booking.station_id,
+                    Booking.start_time,
+                    Booking.end_time,
+                    Booking.total_cost,
+                )
+                .where(
+                    Booking.status == BookingStatus.confirmed,
+                    Booking.end_time <= now,
+                )
+                .order_by(Booking.end_time)
+                .limit(settings.BOOKING_LIFECYCLE_CHUNK_ROWS)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+
+        if not due:
+            return 0
+
+        await session.execute(
+            update(Booking)
+            .where(Booking.id.in_([row.id for row in due]))
+            .values(status=BookingStatus.completed)
+            .execution_options(synchronize_session=False)
+        )
+        await record_completed(session, [row[1:] for row in due])
+        await session.commit()
+
+        stations = await station_cache.get_many(session, {row.station_id for row in due})
+        for owner_id in {station.owner_id for station in stations.values()}:
+            analytics_cache.invalidate_owner(owner_id)
+
+        return len(due)
+
+    async def run_once(self) -> int:
+        """
+        At most BOOKING_LIFECYCLE_MAX_CHUNKS chunks per tick; any backlog
+        is picked up by the next tick. Skipped while a daily stats
+        backfill holds the stats lock.
+        """
+        started = time.perf_counter()
+        now = datetime.utcnow()
+        completed = 0
+
+        async with stats_lock(0) as acquired:
+            if not acquired:
+                metrics.incr("booking_lifecycle.ticks_skipped")
+                return 0
+
+            async with self.db_session_factory() as session:
+                try:
+                    for _ in range(settings.BOOKING_LIFECYCLE_MAX_CHUNKS):
+                        done = await self._complete_chunk(session, now)
+                        completed += done
+                        if done < settings.BOOKING_LIFECYCLE_CHUNK_ROWS:
+                            break
+                    else:
+                        metrics.incr("booking_lifecycle.ticks_saturated")
+
+                except Exception:
+                    await session.rollback()
+                    metrics.incr("booking_lifecycle.failures")
+                    raise
+
+        metrics.incr("booking_lifecycle.ticks")
+        metrics.incr("booking_lifecycle.completed", completed)
+        metrics.set("booking_lifecycle.last_completed", completed)
+        metrics.set("booking_lifecycle.last_tick_seconds", time.perf_counter() - started)
+
+        return completed
+
+    def start(self):
+        self.scheduler.add_job(
+            self.run_once,
+            trigger="interval",
+            seconds=settings.BOOKING_LIFECYCLE_INTERVAL_SECONDS,
+            max_instances=1,
+        )
+        self.scheduler.start()
@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.timeutils import as_naive_utc
+from ..db.pagination import encode_cursor, decode_cursor
+from ..models.models import Booking, BookingStatus
+
+# Page size when a cursor is sent without a limit
+DEFAULT_PAGE_SIZE = 50
+
+# Exactly the columns BookingDetailRead needs
+BOOKING_DETAIL_COLUMNS = (
+    Booking.id,
+    Booking.user_id,
+    Booking.station_id,
+    Booking.start_time,
+    Booking.end_time,
+    Booking.status,
+    Booking.total_cost,
+)
+
+
+async def list_user_bookings_page(
+    session: AsyncSession,
+    *,
+    user_id: int,
+    cursor: str | None,
+    limit: int | None,
+    status: BookingStatus | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+):
+    """
+    Keyset page over one user's bookings, oldest start first.
+
+    • Ordered by (start_time, id), served by idx_booking_user_start
+    • limit=None → every matching booking, no cursor (legacy clients)
+    • since / until filter on start_time, [since, until)
+    • Rows are Core projections (no ORM identity map / hydration)
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    stmt = select(*BOOKING_DETAIL_COLUMNS).where(Booking.user_id == user_id)
+
+    if cursor:
+        last_start, last_id = decode_cursor(cursor, 2)
+        stmt = stmt.where(
+            or_(
+                Booking.start_time > last_start,
+                and_(Booking.start_time == last_start, Booking.id > last_id),
+            )
+        )
+    if status is not None:
+        stmt = stmt.where(Booking.status == status)
+    if since is not None:
+        stmt = stmt.where(Booking.start_time >= as_naive_utc(since))
+    if until is not None:
+        stmt = stmt.where(Booking.start_time < as_naive_utc(until))
+
+    stmt = stmt.order_by(Booking.start_time, Booking.id)
+    if limit is not None:
+        # One extra row tells us whether another page exists
+        stmt = stmt.limit(limit + 1)
+
+    rows = (await session.execute(stmt)).all()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].start_time, rows[-1].id)
+
+    return rows, next_cursor
@@ -0,0 +1,304 @@
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, exists, func, insert, literal, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from ..core.config import settings
+from ..core.timeutils import as_naive_utc
+from ..models.models import Booking, BookingStatus, Station
+from .booking_index import StationIntervals, booking_index
+from .station_cache import SNAPSHOT_COLUMNS, StationSnapshot, station_cache
+
+# ER_LOCK_DEADLOCK, ER_LOCK_WAIT_TIMEOUT
+RETRYABLE_ERRORS = (1213, 1205)
+
+# Seconds a client should wait after retries ran out
+CONTENTION_RETRY_AFTER = 1
+
+
+async def booking_context(
+    session: AsyncSession,
+    station_id: int,
+) -> tuple[StationSnapshot | None, StationIntervals | None]:
+    """
+    Station snapshot + upcoming confirmed bookings for a booking write.
+
+    Served from station_cache / booking_index; if either is cold, one
+    LEFT JOIN reads (and caches) both, so a cold create is still
+    read → conditional INSERT → COMMIT.
+    Returns (None, None) when the station does not exist.
+    """
+    station = station_cache.peek(station_id)
+    intervals = booking_index.peek(station_id)
+    if station is not None and intervals is not None:
+        return station, intervals
+
+    station_generation = station_cache.generation(station_id)
+    generation = booking_index.generation(station_id)
+    rows = (
+        await session.execute(
+            select(*SNAPSHOT_COLUMNS, Booking.id, Booking.start_time, Booking.end_time)
+            .outerjoin(
+                Booking,
+                and_(
+                    Booking.station_id == Station.id,
+                    Booking.status == BookingStatus.confirmed,
+                    Booking.end_time > datetime.utcnow(),
+                ),
+            )
+            .where(Station.id == station_id)
+            .order_by(Booking.start_time)
+        )
+    ).all()
+
+    if not rows:
+        return None, None
+
+    columns = len(SNAPSHOT_COLUMNS)
+    station = StationSnapshot(*rows[0][:columns])
+
+    intervals = StationIntervals()
+    for booking_id, start, end in (row[columns:] for row in rows):
+        if booking_id is not None:
+            intervals.ids.append(booking_id)
+            intervals.starts.append(as_naive_utc(start))
+            intervals.ends.append(as_naive_utc(end))
+
+    station_cache.store(station, station_generation)
+    booking_index.store(station_id, intervals, generation)
+    return station, intervals
+
+
+def conditional_booking_insert(
+    user_id: int,
+    station_id: int,
+    start_time: datetime,
+    end_time: datetime,
+):
+    """
+    INSERT … SELECT that writes the booking only if the station exists
+    and no confirmed booking overlaps [start_time, end_time).
+
+    • The overlap probe is bounded below by BOOKING_MAX_HOURS so it is a
+      short range scan on idx_booking_station_time
+    • InnoDB takes next-key / gap locks on that whole probe range, so
+      requests on one station less than BOOKING_MAX_HOURS apart can
+      block or deadlock each other even when their windows are disjoint
+    • Cost is priced from the station row in the same statement
+    """
+    existing = aliased(Booking)
+    hours = (end_time - start_time).total_seconds() / 3600
+
+    overlap = exists().where(
+        existing.station_id == station_id,
+        existing.status == BookingStatus.confirmed,
+        existing.start_time > start_time - timedelta(hours=settings.BOOKING_MAX_HOURS),
+        existing.start_time < end_time,
+        existing.end_time > start_time,
+    )
+
+    source = select(
+        literal(user_id, Booking.user_id.type),
+        Station.id,
+        literal(start_time, Booking.start_time.type),
+        literal(end_time, Booking.end_time.type),
+        func.round(literal(hours) * Station.price_per_hour, 2),
+        literal(BookingStatus.confirmed, Booking.status.type),
+        literal(1, Booking.version.type),
+    ).where(Station.id == station_id, ~overlap)
+
+    return insert(Booking).from_select(
+        [
+            Booking.user_id,
+            Booking.station_id,
+            Booking.start_time,
+            Booking.end_time,
+            Booking.total_cost,
+            Booking.status,
+            Booking.version,
+        ],
+        source,
+    )
+
+
+async def insert_booking(
+    session: AsyncSession,
+    user_id: int,
+    station_id: int,
+    start_time: datetime,
+    end_time: datetime,
+) -> int | None:
+    """
+    Two round trips: conditional INSERT, COMMIT.
+
+    Returns the new booking id, or None when the window is taken (or the
+    station vanished). Deadlocks and lock wait timeouts between racing
+    inserts are retried; once retries run out the outcome is unknown, so
+    it raises 503 with Retry-After rather than reporting a conflict.
+    """
+    stmt = conditional_booking_insert(
+        user_id, station_id, as_naive_utc(start_time), as_naive_utc(end_time)
+    )
+
+    for attempt in range(settings.BOOKING_DEADLOCK_RETRIES + 1):
+        try:
+            result = await session.execute(stmt)
+
+            if result.rowcount == 0:
+                await session.rollback()
+                return None
+
+            await session.commit()
+            return result.lastrowid
+
+        except OperationalError as exc:
+            await session.rollback()
+            if exc.orig.args[0] not in RETRYABLE_ERRORS:
+                raise
+
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Booking contention, retry later",
+        headers={"Retry-After": str(CONTENTION_RETRY_AFTER)},
+    )
+
+
+def lock_chunks(
+    windows: list[tuple[int, datetime, datetime]],
+) -> list[list[tuple[int, datetime, datetime]]]:
+    """
+    Splits (position, start, end) windows, sorted by start, into runs
+    spanning at most BOOKING_BULK_LOCK_HOURS (a longer single window
+    gets a run of its own).
+    """
+    span = timedelta(hours=settings.BOOKING_BULK_LOCK_HOURS)
+    chunks: list[list[tuple[int, datetime, datetime]]] = []
+
+    for window in windows:
+        if chunks and window[2] - chunks[-1][0][1] <= span:
+            chunks[-1].append(window)
+        else:
+            chunks.append([window])
+
+    return chunks
+
+
+async def insert_bookings_bulk(
+    session: AsyncSession,
+    user_id: int,
+    station_id: int,
+    price_per_hour: float,
+    windows: list[tuple[datetime, datetime]],
+    known: StationIntervals | None = None,
+) -> list[tuple[int | None, str | None]]:
+    """
+    Books every non-conflicting window, one short transaction per chunk.
+
+    • Windows the booking index (`known`) already shows as taken are
+      rejected without touching the database
+    • The rest are handled in start order, in chunks spanning at most
+      BOOKING_BULK_LOCK_HOURS, so a long recurrence never holds range
+      locks over more than one chunk of the station's schedule:
+      1. SELECT … FOR UPDATE over the chunk's range
+      2. Conflicts (with existing rows and earlier requested windows)
+         resolved in memory
+      3. One multi-row INSERT, one read-back of the new ids, COMMIT
+    • Between requested windows the earlier start wins
+
+    Returns (booking_id, None) or (None, reason) per window, in order.
+    """
+    windows = [(as_naive_utc(start), as_naive_utc(end)) for start, end in windows]
+    outcome: list[str | None] = [None] * len(windows)
+    pending = []
+
+    for position, (start, end) in enumerate(windows):
+        if known is not None and known.overlaps(start, end):
+            outcome[position] = "Time slot already booked"
+        else:
+            pending.append((position, start, end))
+
+    pending.sort(key=lambda window: (window[1], window[0]))
+
+    # accepted.ids holds each window's position in the request
+    accepted = StationIntervals()
+    booking_ids: dict[int, int] = {}
+
+    for chunk in lock_chunks(pending):
+        range_start = chunk[0][1]
+        range_end = max(end for _, _, end in chunk)
+
+        in_range = (
+            Booking.station_id == station_id,
+            Booking.status == BookingStatus.confirmed,
+            Booking.start_time > range_start - timedelta(hours=settings.BOOKING_MAX_HOURS),
+            Booking.start_time < range_end,
+            Booking.end_time > range_start,
+        )
+
+        rows = await session.execute(
+            select(Booking.id, Booking.start_time, Booking.end_time)
+            .where(*in_range)
+            .order_by(Booking.start_time)
+            .with_for_update()
+        )
+
+        existing = StationIntervals()
+        for booking_id, start, end in rows.all():
+            existing.add(booking_id, start, end)
+
+        chunk_accepted = []
+        for position, start, end in chunk:
+            if existing.overlaps(start, end):
+                outcome[position] = "Time slot already booked"
+            elif accepted.overlaps(start, end):
+                outcome[position] = "Overlaps another requested window"
+            else:
+                accepted.add(position, start, end)
+                chunk_accepted.append((position, start, end))
+
+        if not chunk_accepted:
+            await session.rollback()
+            continue
+
+        await session.execute(
+            insert(Booking).values(
+                [
+                    {
+                        "user_id": user_id,
+                        "station_id": station_id,
+                        "start_time": start,
+                        "end_time": end,
+                        "total_cost": round(
+                            (end - start).total_seconds() / 3600 * price_per_hour, 2
+                        ),
+                        "status": BookingStatus.confirmed,
+                        "version": 1,
+                    }
+                    for _, start, end in chunk_accepted
+                ]
+            )
+        )
+
+        # The FOR UPDATE range lock keeps other writers out of in_range, so
+        # its rows that were not there before are exactly the ones just
+        # inserted; both sides are ordered by start_time
+        inserted = (
+            await session.execute(
+                select(Booking.id)
+                .where(*in_range, Booking.id.not_in(existing.ids))
+                .order_by(Booking.start_time)
+            )
+        ).scalars().all()
+        booking_ids.update(
+            zip((position for position, _, _ in chunk_accepted), inserted)
+        )
+
+        await session.commit()
+
+    return [
+        (None, reason) if reason else (booking_ids[position], None)
+        for position, reason in enumerate(outcome)
+    ]
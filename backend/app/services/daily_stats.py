@@ -0,0 +1,165 @@
+"""
+station_daily_stats maintenance.
+
+Incremental updates run inside the transaction that changes the
+booking's status, so the aggregates and bookings commit together.
+Backfill (one-off, or to repair drift):
+
+    cd backend
+    python -m app.services.daily_stats
+
+The backfill and the booking lifecycle job hold the STATS_LOCK named
+lock while they run, so a tick never folds rows into a table that is
+being rebuilt. Cancels are not serialized this way: their upsert waits
+on the backfill's row locks and at worst fails with a deadlock.
+"""
+
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.session import AsyncSessionLocal, engine
+from ..models.models import Booking, BookingStatus, StationDailyStats
+
+COUNTERS = ("completed_bookings", "cancelled_bookings", "revenue")
+
+# MySQL named lock (GET_LOCK) shared by the backfill and the lifecycle job
+STATS_LOCK = "station_daily_stats"
+
+# Seconds the backfill waits for a running lifecycle tick
+BACKFILL_LOCK_WAIT = 300
+
+
+@asynccontextmanager
+async def stats_lock(timeout: float) -> AsyncIterator[bool]:
+    """
+    Holds STATS_LOCK for the block; yields False if it was not acquired
+    within `timeout` seconds (0: don't wait).
+
+    Named locks belong to a connection, and a session may switch
+    connections between transactions, so the lock lives on a dedicated
+    connection held for the whole block.
+    """
+    async with engine.connect() as conn:
+        acquired = (await conn.execute(select(func.get_lock(STATS_LOCK, timeout)))).scalar() == 1
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await conn.execute(select(func.release_lock(STATS_LOCK)))
+
+
+async def _add(session: AsyncSession, deltas: dict[tuple, dict[str, float]]):
+    """
+    deltas: (station_id, day) → {counter: increment}
+    One multi-row upsert that adds to existing rows.
+    """
+    if not deltas:
+        return
+
+    stmt = mysql_insert(StationDailyStats).values(
+        [
+            {
+                "station_id": station_id,
+                "day": day,
+                **{name: counters.get(name, 0) for name in COUNTERS},
+            }
+            for (station_id, day), counters in deltas.items()
+        ]
+    )
+    table = StationDailyStats.__table__.c
+    stmt = stmt.on_duplicate_key_update(
+        {name: table[name] + stmt.inserted[name] for name in COUNTERS}
+    )
+
+    await session.execute(stmt)
+
+
+async def record_completed(session: AsyncSession, bookings):
+    """
+    bookings: iterable of (station_id, start_time, end_time, total_cost)
+    for rows that just moved confirmed → completed.
+    """
+    deltas = defaultdict(dict)
+
+    for station_id, start_time, end_time, total_cost in bookings:
+        started = deltas[(station_id, start_time.date())]
+        started["completed_bookings"] = started.get("completed_bookings", 0) + 1
+
+        ended = deltas[(station_id, end_time.date())]
+        ended["revenue"] = ended.get("revenue", 0) + (total_cost or 0)
+
+    await _add(session, deltas)
+
+
+async def record_cancelled(session: AsyncSession, station_id: int, start_time: datetime):
+    await _add(session, {(station_id, start_time.date()): {"cancelled_bookings": 1}})
+
+
+async def backfill(session: AsyncSession):
+    """
+    Rebuilds the whole table from bookings in one transaction:
+    counts by start day, then revenue by end day. Holds STATS_LOCK,
+    waiting up to BACKFILL_LOCK_WAIT for a running lifecycle tick.
+    """
+    async with stats_lock(BACKFILL_LOCK_WAIT) as acquired:
+        if not acquired:
+            raise RuntimeError(f"{STATS_LOCK} lock is busy; retry when the lifecycle tick ends")
+        await _rebuild(session)
+
+
+async def _rebuild(session: AsyncSession):
+    await session.execute(delete(StationDailyStats))
+
+    start_day = func.date(Booking.start_time)
+    counts = (
+        select(
+            Booking.station_id,
+            start_day,
+            func.sum(case((Booking.status == BookingStatus.completed, 1), else_=0)),
+            func.sum(case((Booking.status == BookingStatus.cancelled, 1), else_=0)),
+        )
+        .where(Booking.status != BookingStatus.confirmed)
+        .group_by(Booking.station_id, start_day)
+    )
+    await session.execute(
+        mysql_insert(StationDailyStats).from_select(
+            ["station_id", "day", "completed_bookings", "cancelled_bookings"],
+            counts,
+        )
+    )
+
+    end_day = func.date(Booking.end_time)
+    revenue = (
+        select(
+            Booking.station_id,
+            end_day,
+            func.coalesce(func.sum(Booking.total_cost), 0),
+        )
+        .where(Booking.status == BookingStatus.completed)
+        .group_by(Booking.station_id, end_day)
+    )
+    stmt = mysql_insert(StationDailyStats).from_select(
+        ["station_id", "day", "revenue"], revenue
+    )
+    await session.execute(
+        stmt.on_duplicate_key_update(revenue=stmt.inserted.revenue)
+    )
+
+    await session.commit()
+
+
+async def _main():
+    async with AsyncSessionLocal() as session:
+        await backfill(session)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,41 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets.
+    Returns the indices of at most `threshold` points that preserve
+    the visual shape of (x, y). x must be sorted ascending.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    # Interior points split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    previous = 0
+
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Average of the next bucket (or the last point)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        px, py = x[previous], y[previous]
+        area = np.abs(
+            (px - avg_x) * (y[start:end] - py)
+            - (px - x[start:end]) * (avg_y - py)
+        )
+
+        previous = start + int(area.argmax())
+        selected[i + 1] = previous
+
+    return selected
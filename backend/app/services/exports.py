@@ -0,0 +1,78 @@
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, Literal
+
+from sqlalchemy import Select
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..core.config import settings
+from ..db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _plain(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([[_plain(value) for value in row] for row in rows])
+    return buffer.getvalue()
+
+
+def _ndjson_chunk(columns: list[str], rows) -> str:
+    return "".join(
+        json.dumps(dict(zip(columns, map(_plain, row))), separators=(",", ":")) + "\n"
+        for row in rows
+    )
+
+
+async def stream_export(stmt: Select, fmt: ExportFormat) -> AsyncIterator[str]:
+    """
+    Serializes a SELECT as CSV / NDJSON, one chunk per server-side
+    cursor partition (EXPORT_CHUNK_ROWS rows), so memory stays flat.
+
+    Opens its own session: the request-scoped one is already closed
+    by the time StreamingResponse iterates the body.
+
+    The 200 status is sent before the first row, so a database error
+    mid-stream is logged and then:
+    • NDJSON: ends the body with an {"error": …} record
+    • CSV: re-raised, aborting the transfer (no in-band marker exists)
+    """
+    columns = [column.name for column in stmt.selected_columns]
+
+    if fmt == "csv":
+        yield _csv_chunk([columns])
+
+    try:
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(
+                stmt.execution_options(yield_per=settings.EXPORT_CHUNK_ROWS)
+            )
+
+            async for rows in result.partitions():
+                yield _csv_chunk(rows) if fmt == "csv" else _ndjson_chunk(columns, rows)
+
+    except SQLAlchemyError:
+        logger.exception("Export aborted by a database error")
+        if fmt == "csv":
+            raise
+        yield json.dumps({"error": "export aborted, output is incomplete"}) + "\n"
@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+from sqlalchemy import func
+
+from ..models.models import Station
+
+# Radius used by MySQL's ST_Distance_Sphere (meters → km)
+EARTH_RADIUS_KM = 6370.986
+
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def bounding_box(lat: float, lng: float, radius_km: float):
+    """
+    Lat/lng box containing every point within radius_km.
+    Returns (min_lat, min_lng, max_lat, max_lng).
+    Near the poles or across the antimeridian the longitude
+    range widens to the full [-180, 180].
+    """
+    delta_lat = radius_km / KM_PER_DEGREE
+    min_lat = max(-90.0, lat - delta_lat)
+    max_lat = min(90.0, lat + delta_lat)
+
+    # Widest parallel inside the box decides the longitude span
+    widest = max(abs(min_lat), abs(max_lat))
+    if widest >= 90.0:
+        return min_lat, -180.0, max_lat, 180.0
+
+    delta_lng = radius_km / (KM_PER_DEGREE * math.cos(math.radians(widest)))
+    min_lng, max_lng = lng - delta_lng, lng + delta_lng
+
+    if min_lng < -180.0 or max_lng > 180.0:
+        return min_lat, -180.0, max_lat, 180.0
+
+    return min_lat, min_lng, max_lat, max_lng
+
+
+def envelope(min_lat: float, min_lng: float, max_lat: float, max_lng: float):
+    """
+    SRID 4326 rectangle built the same way as stations.location
+    (POINT(lng, lat) tagged with ST_SRID), so axis order matches.
+    """
+    return func.ST_SRID(
+        func.ST_MakeEnvelope(
+            func.POINT(min_lng, min_lat),
+            func.POINT(max_lng, max_lat),
+        ),
+        4326,
+    )
+
+
+def within_box(min_lat: float, min_lng: float, max_lat: float, max_lng: float):
+    """
+    MBR predicate the stations.location R-tree index can serve.
+    """
+    return func.MBRContains(
+        envelope(min_lat, min_lng, max_lat, max_lng),
+        Station.location,
+    )
+
+
+def near(lat: float, lng: float, radius_km: float):
+    """
+    Index-friendly prefilter for "within radius_km of (lat, lng)".
+    Callers still apply the exact ST_Distance_Sphere check.
+    """
+    return within_box(*bounding_box(lat, lng, radius_km))
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """
+    Great-circle distance, vectorized over NumPy arrays.
+    """
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
@@ -0,0 +1,104 @@
+import math
+
+import numpy as np
+
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.metrics import metrics
+
+MAX_ZOOM = 22
+
+# Clusters per tile side (GRID × GRID cells per tile)
+GRID = 8
+
+
+def tile_bounds(z: int, x: int, y: int):
+    """
+    Slippy-map (Web Mercator) tile → (min_lat, min_lng, max_lat, max_lng).
+    """
+    n = 2 ** z
+
+    def lat(row):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return lat(y + 1), x / n * 360 - 180, lat(y), (x + 1) / n * 360 - 180
+
+
+def tile_for(lat: float, lng: float, z: int):
+    """
+    Tile (x, y) containing a point at zoom z.
+    """
+    n = 2 ** z
+    lat = max(-85.0511, min(85.0511, lat))
+    x = int((lng + 180) / 360 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def cluster(bounds, lats, lngs, available, critical):
+    """
+    Aggregates stations into a GRID × GRID lattice over the tile.
+    All inputs are equal-length NumPy arrays; returns non-empty
+    cells with count, centroid and available / critical counts.
+    """
+    if not len(lats):
+        return []
+
+    min_lat, min_lng, max_lat, max_lng = bounds
+    rows = np.clip(((lats - min_lat) / (max_lat - min_lat) * GRID).astype(np.int64), 0, GRID - 1)
+    cols = np.clip(((lngs - min_lng) / (max_lng - min_lng) * GRID).astype(np.int64), 0, GRID - 1)
+    cells = rows * GRID + cols
+
+    size = GRID * GRID
+    counts = np.bincount(cells, minlength=size)
+    lat_sums = np.bincount(cells, weights=lats, minlength=size)
+    lng_sums = np.bincount(cells, weights=lngs, minlength=size)
+    available_counts = np.bincount(cells, weights=available, minlength=size)
+    critical_counts = np.bincount(cells, weights=critical, minlength=size)
+
+    return [
+        {
+            "count": int(counts[cell]),
+            "lat": float(lat_sums[cell] / counts[cell]),
+            "lng": float(lng_sums[cell] / counts[cell]),
+            "available": int(available_counts[cell]),
+            "critical": int(critical_counts[cell]),
+        }
+        for cell in np.flatnonzero(counts).tolist()
+    ]
+
+
+# (z, x, y) → cluster list
+tile_cache = TTLCache(
+    maxsize=settings.MAP_TILE_CACHE_SIZE,
+    ttl=settings.MAP_TILE_CACHE_TTL_SECONDS,
+)
+metrics.register("tile_cache", tile_cache.stats)
+
+# Same, for z <= MAP_TILE_OVERVIEW_MAX_ZOOM. Such a tile covers a large
+# share of the fleet (every active station at z0) and its miss scores all
+# of them, so it is only refreshed by TTL instead of on every change
+overview_tile_cache = TTLCache(
+    maxsize=settings.MAP_TILE_CACHE_SIZE,
+    ttl=settings.MAP_TILE_OVERVIEW_TTL_SECONDS,
+)
+metrics.register("overview_tile_cache", overview_tile_cache.stats)
+
+
+def cache_for(z: int) -> TTLCache:
+    """
+    Tile cache responsible for zoom level z.
+    """
+    if z <= settings.MAP_TILE_OVERVIEW_MAX_ZOOM:
+        return overview_tile_cache
+    return tile_cache
+
+
+def invalidate_point(lat: float, lng: float):
+    """
+    Drops the cached tile containing the point at every zoom level above
+    MAP_TILE_OVERVIEW_MAX_ZOOM (overview tiles age out by TTL).
+    Called when a station's status or availability changes.
+    """
+    for z in range(settings.MAP_TILE_OVERVIEW_MAX_ZOOM + 1, MAX_ZOOM + 1):
+        tile_cache.pop((z, *tile_for(lat, lng, z)))
@@ -1,9 +1,12 @@
-import random
+from datetime import datetime
+
+import numpy as np
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..websockets import ws_manager
 from ..services.ai_singleton import ai_service
+from ..services.telemetry_ring import telemetry_ring, to_epoch
 from ..schemas import station
 from ..models.models import Station, StationTelemetry, StationStatus
 
@@ -17,6 +20,30 @@ class IoTSimulatorService:
         """
         self.db_session_factory = db_session_factory
         self.scheduler = AsyncIOScheduler()
+        self.rng = np.random.default_rng()
+
+    def _generate_batch(self, count: int):
+        """
+        Draws one reading per station as NumPy arrays.
+        Fault injection (5% probability, split evenly between
+        overheat and undervoltage) is applied through boolean masks.
+        """
+        rng = self.rng
+
+        # Base normal operating values
+        voltage = rng.normal(220, 5, count)
+        current = rng.normal(32, 2, count)
+        temperature = rng.normal(40, 5, count)
+
+        # Fault injection: 5% probability
+        faulty = rng.random(count) < 0.05
+        overheat = faulty & (rng.random(count) < 0.5)
+        undervoltage = faulty & ~overheat
+
+        temperature[overheat] = rng.normal(90, 3, int(overheat.sum()))
+        voltage[undervoltage] = rng.normal(160, 5, int(undervoltage.sum()))
+
+        return voltage, current, temperature
 
     async def _generate_and_store(self):
         """
@@ -28,50 +55,66 @@ class IoTSimulatorService:
         async with self.db_session_factory() as session:  # AsyncSession
             try:
                 result = await session.execute(
-                    select(Station).where(Station.status == StationStatus.active)
-                )
-                stations = result.scalars().all()
-
-                telemetry_rows = []
-
-                for station in stations:
-                    # Base normal operating values
-                    voltage = random.gauss(220, 5)
-                    current = random.gauss(32, 2)
-                    temperature = random.gauss(40, 5)
-
-                    # Fault injection: 5% probability
-                    if random.random() < 0.05:
-                        if random.choice([True, False]):
-                            temperature = random.gauss(90, 3)  # Overheat
-                        else:
-                            voltage = random.gauss(160, 5)  # Undervoltage
-
-                    telemetry_rows.append(
-                        StationTelemetry(
-                            station_id=station.id,
-                            voltage=voltage,
-                            current=current,
-                            temperature=temperature,
-                        )
+                    select(Station.id, Station.owner_id).where(
+                        Station.status == StationStatus.active
                     )
-                    
-                    ai_result = await ai_service.analyze_station(session, station.id)
-
-                    payload = {
-                        "station_id": station.id,
-                        "voltage": voltage,
-                        "current": current,
-                        "temperature": temperature,
-                        "health": ai_result["risk_level"],
-                        "alert": ai_result["risk_level"] == "HIGH",
+                )
+                stations = result.all()
+
+                if not stations:
+                    return
+
+                station_ids = [station_id for station_id, _ in stations]
+                voltage, current, temperature = self._generate_batch(len(stations))
+                now = datetime.utcnow()
+
+                telemetry_rows = [
+                    {
+                        "station_id": station_id,
+                        "voltage": v,
+                        "current": c,
+                        "temperature": t,
+                        "timestamp": now,
                     }
-                    await ws_manager.send(station.owner_id, payload)
+                    for station_id, v, c, t in zip(
+                        station_ids,
+                        voltage.tolist(),
+                        current.tolist(),
+                        temperature.tolist(),
+                    )
+                ]
 
+                # Core executemany → multi-row INSERT, no ORM unit of work
+                await session.execute(insert(StationTelemetry), telemetry_rows)
+                await session.commit()
 
-                if telemetry_rows:
-                    session.add_all(telemetry_rows)
-                    await session.commit()
+                # Keep hot-read ring buffers in step with the table
+                telemetry_ring.append_many(
+                    station_ids,
+                    np.column_stack([voltage, current, temperature]),
+                    np.full(len(station_ids), to_epoch([now])[0]),
+                )
+
+                # One windowed query + one predict() for the whole fleet
+                ai_results = await ai_service.analyze_stations(session, station_ids)
+
+                for (station_id, owner_id), row in zip(stations, telemetry_rows):
+                    # Skip payload building for owners without a live socket
+                    if owner_id not in ws_manager.active_connections:
+                        continue
+
+                    ai_result = ai_results[station_id]
+                    await ws_manager.send(
+                        owner_id,
+                        {
+                            "station_id": station_id,
+                            "voltage": row["voltage"],
+                            "current": row["current"],
+                            "temperature": row["temperature"],
+                            "health": ai_result["risk_level"],
+                            "alert": ai_result["risk_level"] == "HIGH",
+                        },
+                    )
 
             except Exception:
                 await session.rollback()
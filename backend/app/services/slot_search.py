@@ -0,0 +1,74 @@
+import numpy as np
+
+
+def earliest_slots(
+    station_count: int,
+    ranks: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    origin: float,
+    horizon: float,
+    duration: float,
+) -> np.ndarray:
+    """
+    Earliest start of a free [t, t + duration) window per station.
+
+    • ranks / starts / ends describe busy intervals (epoch seconds),
+      sorted by (rank, start); rank is the station's position 0..n-1
+    • Search is limited to [origin, horizon]
+    • Returns float array of length station_count, NaN where nothing fits
+
+    One pass, no Python loop: a per-station running max of interval ends
+    (offset by rank so stations never mix) gives the free gap before
+    every interval plus the tail gap after each station's last one.
+    """
+    slots = np.full(station_count, np.nan)
+    span = horizon - origin
+
+    if duration > span:
+        return slots
+
+    if ranks.size == 0:
+        slots[:] = origin
+        return slots
+
+    starts = np.clip(starts, origin, horizon) - origin
+    ends = np.clip(ends, origin, horizon) - origin
+
+    # Per-station cumulative max of ends
+    offset = ranks * (span + 1)
+    busy_until = np.maximum.accumulate(ends + offset) - offset
+
+    first = np.ones(ranks.size, dtype=bool)
+    first[1:] = ranks[1:] != ranks[:-1]
+
+    prev_end = np.zeros(ranks.size)
+    prev_end[1:] = busy_until[:-1]
+    prev_end[first] = 0.0
+
+    last = np.ones(ranks.size, dtype=bool)
+    last[:-1] = first[1:]
+
+    # Candidates: gap before each interval, tail after each station's last
+    cand_rank = np.concatenate([ranks, ranks[last]])
+    cand_start = np.concatenate([prev_end, busy_until[last]])
+    cand_end = np.concatenate([starts, np.full(last.sum(), span)])
+
+    fits = cand_end - cand_start >= duration
+    cand_rank = cand_rank[fits]
+    cand_start = cand_start[fits]
+
+    # Earliest fitting candidate per station
+    order = np.lexsort((cand_start, cand_rank))
+    cand_rank = cand_rank[order]
+    cand_start = cand_start[order]
+    keep = np.ones(cand_rank.size, dtype=bool)
+    keep[1:] = cand_rank[1:] != cand_rank[:-1]
+    slots[cand_rank[keep]] = cand_start[keep] + origin
+
+    # Stations without any busy interval are free from the origin
+    idle = np.ones(station_count, dtype=bool)
+    idle[ranks] = False
+    slots[idle] = origin
+
+    return slots
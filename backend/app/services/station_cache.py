@@ -0,0 +1,133 @@
+from collections import defaultdict
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..models.models import Station, StationStatus
+
+
+@dataclass(frozen=True)
+class StationSnapshot:
+    """
+    Immutable view of the station attributes read on hot paths.
+    """
+
+    id: int
+    owner_id: int
+    status: StationStatus
+    price_per_hour: float
+    price_per_kwh: float | None
+    location_lat: float
+    location_lng: float
+
+
+SNAPSHOT_COLUMNS = (
+    Station.id,
+    Station.owner_id,
+    Station.status,
+    Station.price_per_hour,
+    Station.price_per_kwh,
+    Station.location_lat,
+    Station.location_lng,
+)
+
+
+class StationCatalogCache:
+    """
+    Process-wide read-through cache: station id → StationSnapshot.
+
+    • Bounded (LRU) with a TTL as a safety net for writes made by
+      other processes
+    • Writes in this process call invalidate() explicitly, which bumps
+      the station's generation; a read only caches its row if the
+      generation did not move while it ran, so a read that began before
+      an invalidate() never stores the pre-write snapshot after it
+    • Missing stations are not cached (a later create must be visible)
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations: dict[int, int] = defaultdict(int)
+
+    async def get(self, session: AsyncSession, station_id: int) -> StationSnapshot | None:
+        snapshot = self._cache.get(station_id)
+        if snapshot is not None:
+            return snapshot
+
+        generation = self.generation(station_id)
+        row = (
+            await session.execute(
+                select(*SNAPSHOT_COLUMNS).where(Station.id == station_id)
+            )
+        ).one_or_none()
+
+        if row is None:
+            return None
+
+        snapshot = StationSnapshot(*row)
+        self.store(snapshot, generation)
+        return snapshot
+
+    async def get_many(self, session: AsyncSession, station_ids) -> dict[int, StationSnapshot]:
+        """
+        Snapshots for every existing id; misses share one IN query.
+        """
+        found = {}
+        missing = []
+
+        for station_id in set(station_ids):
+            snapshot = self._cache.get(station_id)
+            if snapshot is None:
+                missing.append(station_id)
+            else:
+                found[station_id] = snapshot
+
+        if missing:
+            generations = {station_id: self.generation(station_id) for station_id in missing}
+            rows = await session.execute(
+                select(*SNAPSHOT_COLUMNS).where(Station.id.in_(missing))
+            )
+            for row in rows.all():
+                snapshot = StationSnapshot(*row)
+                self.store(snapshot, generations[snapshot.id])
+                found[snapshot.id] = snapshot
+
+        return found
+
+    def peek(self, station_id: int) -> StationSnapshot | None:
+        """
+        Cached snapshot or None; never reads the database.
+        """
+        return self._cache.get(station_id)
+
+    def generation(self, station_id: int) -> int:
+        """
+        Read before querying; pass the value to store().
+        """
+        return self._generations[station_id]
+
+    def store(self, snapshot: StationSnapshot, generation: int):
+        """
+        Caches a snapshot read by a caller's own (combined) query, unless
+        the station was invalidated since `generation` was taken.
+        """
+        if self._generations[snapshot.id] == generation:
+            self._cache.set(snapshot.id, snapshot)
+
+    def invalidate(self, station_id: int):
+        self._generations[station_id] += 1
+        self._cache.pop(station_id)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+station_cache = StationCatalogCache(
+    maxsize=settings.STATION_CACHE_SIZE,
+    ttl=settings.STATION_CACHE_TTL_SECONDS,
+)
+metrics.register("station_cache", station_cache.stats)
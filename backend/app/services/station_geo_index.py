@@ -0,0 +1,146 @@
+import math
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.models import Station, StationStatus
+from ..services.geo import bounding_box, haversine_km, KM_PER_DEGREE
+
+# Longest possible great-circle distance
+MAX_RADIUS_KM = math.pi * 6371
+
+
+class IndexedStation(NamedTuple):
+    station_id: int
+    lat: float
+    lng: float
+    price_per_hour: float
+
+
+class StationGeoIndex:
+    """
+    Process-local geohash-style grid over active stations.
+
+    • Cells are cell_degrees × cell_degrees lat/lng squares
+    • radius() scans only the cells under the query's bounding box
+      and computes exact haversine distances with NumPy
+    • nearest() grows the search radius until k stations are found
+    Built once in lifespan, then kept current by station writes.
+    """
+
+    def __init__(self, cell_degrees: float = 0.5):
+        self.cell_degrees = cell_degrees
+        self._stations: dict[int, IndexedStation] = {}
+        self._cells: dict[tuple[int, int], set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._stations)
+
+    def _cell(self, lat: float, lng: float) -> tuple[int, int]:
+        return (
+            math.floor(lat / self.cell_degrees),
+            math.floor(lng / self.cell_degrees),
+        )
+
+    # -------------------------
+    # WRITES
+    # -------------------------
+
+    def remove(self, station_id: int):
+        entry = self._stations.pop(station_id, None)
+        if entry is None:
+            return
+
+        cell = self._cell(entry.lat, entry.lng)
+        members = self._cells.get(cell)
+        if members is not None:
+            members.discard(station_id)
+            if not members:
+                del self._cells[cell]
+
+    def sync(self, station: Station):
+        """
+        Reflects one station write: active stations are (re)indexed,
+        anything else is dropped from the index.
+        """
+        self.remove(station.id)
+
+        if station.status != StationStatus.active:
+            return
+
+        self._stations[station.id] = IndexedStation(
+            station.id,
+            station.location_lat,
+            station.location_lng,
+            station.price_per_hour,
+        )
+        self._cells.setdefault(
+            self._cell(station.location_lat, station.location_lng), set()
+        ).add(station.id)
+
+    async def rebuild(self, session: AsyncSession):
+        result = await session.execute(
+            select(Station).where(Station.status == StationStatus.active)
+        )
+
+        self._stations.clear()
+        self._cells.clear()
+
+        for station in result.scalars():
+            self.sync(station)
+
+    # -------------------------
+    # QUERIES
+    # -------------------------
+
+    def radius(self, lat: float, lng: float, radius_km: float):
+        """
+        Stations within radius_km, nearest first, as
+        [(IndexedStation, distance_km), ...].
+        """
+        min_lat, min_lng, max_lat, max_lng = bounding_box(lat, lng, radius_km)
+        low_row, low_col = self._cell(min_lat, min_lng)
+        high_row, high_col = self._cell(max_lat, max_lng)
+
+        candidates = []
+        for row in range(low_row, high_row + 1):
+            for col in range(low_col, high_col + 1):
+                members = self._cells.get((row, col))
+                if members:
+                    candidates.extend(members)
+
+        if not candidates:
+            return []
+
+        entries = [self._stations[station_id] for station_id in candidates]
+        distances = haversine_km(
+            lat,
+            lng,
+            np.array([entry.lat for entry in entries]),
+            np.array([entry.lng for entry in entries]),
+        )
+
+        inside = np.flatnonzero(distances <= radius_km)
+        ordered = inside[np.argsort(distances[inside], kind="stable")]
+
+        return [(entries[i], float(distances[i])) for i in ordered.tolist()]
+
+    def nearest(self, lat: float, lng: float, k: int, max_radius_km: float = MAX_RADIUS_KM):
+        """
+        k nearest stations (within max_radius_km), nearest first.
+        """
+        radius_km = self.cell_degrees * KM_PER_DEGREE
+
+        while True:
+            radius_km = min(radius_km, max_radius_km)
+            hits = self.radius(lat, lng, radius_km)
+
+            if len(hits) >= k or radius_km >= max_radius_km:
+                return hits[:k]
+
+            radius_km *= 2
+
+
+station_geo_index = StationGeoIndex()
@@ -0,0 +1,97 @@
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.pagination import encode_cursor, decode_cursor
+from ..models.models import Station, StationStatus
+
+# Page size when a cursor is sent without a limit
+DEFAULT_PAGE_SIZE = 100
+
+# Sparse-fieldset names → columns (lat / lng match the driver map keys)
+STATION_FIELDS = {
+    "id": Station.id,
+    "owner_id": Station.owner_id,
+    "name": Station.name,
+    "lat": Station.location_lat,
+    "lng": Station.location_lng,
+    "location_lat": Station.location_lat,
+    "location_lng": Station.location_lng,
+    "status": Station.status,
+    "price_per_hour": Station.price_per_hour,
+    "price_per_kwh": Station.price_per_kwh,
+    "version": Station.version,
+}
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """
+    "id,lat,lng" → ["id", "lat", "lng"]; id is always included
+    because it is the pagination key.
+    """
+    if not fields:
+        return None
+
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in STATION_FIELDS]
+
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+
+    return list(dict.fromkeys(["id", *names]))
+
+
+async def list_stations_page(
+    session: AsyncSession,
+    *,
+    cursor: str | None,
+    limit: int | None,
+    status: StationStatus | None = None,
+    owner_id: int | None = None,
+    fields: list[str] | None = None,
+):
+    """
+    Keyset page over stations ordered by id.
+
+    • limit=None → every matching station, no cursor (legacy clients)
+    • fields=None → Station ORM objects
+    • fields=[...] → plain dicts from a Core column projection
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    if fields is None:
+        stmt = select(Station)
+    else:
+        stmt = select(*(STATION_FIELDS[name].label(name) for name in fields))
+
+    if cursor:
+        (after_id,) = decode_cursor(cursor, 1)
+        stmt = stmt.where(Station.id > after_id)
+    if status is not None:
+        stmt = stmt.where(Station.status == status)
+    if owner_id is not None:
+        stmt = stmt.where(Station.owner_id == owner_id)
+
+    stmt = stmt.order_by(Station.id)
+    if limit is not None:
+        # One extra row tells us whether another page exists
+        stmt = stmt.limit(limit + 1)
+
+    result = await session.execute(stmt)
+
+    if fields is None:
+        items = list(result.scalars().all())
+    else:
+        items = [dict(row._mapping) for row in result.all()]
+
+    def item_id(item) -> int:
+        return item.id if fields is None else item["id"]
+
+    next_cursor = None
+    if limit is not None and len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(item_id(items[-1]))
+
+    return items, next_cursor
@@ -0,0 +1,177 @@
+import asyncio
+import logging
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..db.session import AsyncSessionLocal
+from ..models.models import StationTelemetry
+from .telemetry_ring import telemetry_ring
+
+logger = logging.getLogger(__name__)
+
+# Errors caused by the rows themselves (bad value, unknown key...):
+# isolated by bisecting and dropped. Anything else (connection loss,
+# lock timeouts, deadlocks) says nothing about the rows: they are kept
+ROW_ERRORS = (IntegrityError, DataError)
+
+
+class TelemetryWriteBuffer:
+    """
+    In-memory write-behind buffer for ingested telemetry.
+
+    • offer() is synchronous and never touches the database
+    • A background task flushes in large multi-row INSERTs when the
+      size threshold is reached or the flush interval elapses
+    • Memory is bounded: rows waiting + rows being flushed never
+      exceed max_rows, offer() returns False instead
+    """
+
+    def __init__(
+        self,
+        db_session_factory,
+        max_rows: int,
+        flush_rows: int,
+        flush_interval: float,
+    ):
+        self.db_session_factory = db_session_factory
+        self.max_rows = max_rows
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+
+        self._pending: list[dict] = []
+        self._inflight = 0
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending) + self._inflight
+
+    def offer(self, rows: list[dict]) -> bool:
+        """
+        Accepts a batch atomically.
+        Returns False (nothing buffered) when the batch does not fit.
+        """
+        if len(self) + len(rows) > self.max_rows:
+            return False
+
+        self._pending.extend(rows)
+
+        if len(self._pending) >= self.flush_rows:
+            self._wakeup.set()
+
+        return True
+
+    async def _insert(self, rows: list[dict]):
+        async with self.db_session_factory() as session:
+            for offset in range(0, len(rows), self.flush_rows):
+                await session.execute(
+                    insert(StationTelemetry),
+                    rows[offset : offset + self.flush_rows],
+                )
+            await session.commit()
+
+        # Hot reads only ever see committed readings
+        telemetry_ring.append_rows(rows)
+
+    def _requeue(self, rows: list[dict]):
+        room = self.max_rows - len(self._pending)
+        self._pending[:0] = rows[:room]
+
+    async def _bisect(self, rows: list[dict]) -> list[dict]:
+        """
+        Writes rows in halves (each committing on its own) until the
+        offending rows are isolated, then drops and counts them.
+
+        Stops at the first error that is not a ROW_ERROR and returns the
+        rows not written yet, so a database outage never drops data.
+        """
+        stack = [rows]
+        while stack:
+            chunk = stack.pop()
+            try:
+                await self._insert(chunk)
+            except ROW_ERRORS as exc:
+                if len(chunk) == 1:
+                    logger.warning("Dropping unwritable telemetry row %r: %s", chunk[0], exc)
+                    metrics.incr("telemetry_buffer.dropped_rows")
+                    continue
+                middle = len(chunk) // 2
+                stack += [chunk[middle:], chunk[:middle]]
+            except Exception:
+                logger.exception("Telemetry flush interrupted (%d rows kept)", len(chunk))
+                return [row for pending in [chunk, *reversed(stack)] for row in pending]
+        return []
+
+    async def flush(self):
+        """
+        Drains everything pending into station_telemetry.
+
+        • Row errors (integrity / data) bisect the batch so only rows
+          that cannot be written are dropped; one bad row can no longer
+          wedge the buffer
+        • Any other failure puts the unwritten rows back (space
+          permitting) for the next tick
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            batch, self._pending = self._pending, []
+            self._inflight = len(batch)
+
+            try:
+                try:
+                    await self._insert(batch)
+                    unwritten = []
+                except ROW_ERRORS:
+                    unwritten = await self._bisect(batch)
+                except Exception:
+                    logger.exception("Telemetry flush failed (%d rows)", len(batch))
+                    unwritten = batch
+
+                if unwritten:
+                    self._requeue(unwritten)
+
+            finally:
+                self._inflight = 0
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+
+            self._wakeup.clear()
+            # Shielded so stop() cannot abort a flush halfway through
+            await asyncio.shield(self.flush())
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stops the flusher and writes out whatever is still buffered.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+
+telemetry_buffer = TelemetryWriteBuffer(
+    AsyncSessionLocal,
+    max_rows=settings.TELEMETRY_BUFFER_MAX_ROWS,
+    flush_rows=settings.TELEMETRY_BUFFER_FLUSH_ROWS,
+    flush_interval=settings.TELEMETRY_BUFFER_FLUSH_SECONDS,
+)
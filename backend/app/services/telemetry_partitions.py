@@ -0,0 +1,93 @@
+from datetime import date, datetime, timedelta
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import text
+
+from ..core.config import settings
+
+
+class TelemetryPartitionService:
+    def __init__(self, db_session_factory):
+        """
+        db_session_factory: callable returning AsyncSession
+        Keeps station_telemetry's daily RANGE partitions rolling:
+        • creates partitions TELEMETRY_PARTITIONS_AHEAD days ahead
+        • drops partitions older than TELEMETRY_RETENTION_DAYS
+        Retention is a metadata-only DROP PARTITION, never a DELETE.
+        """
+        self.db_session_factory = db_session_factory
+        self.scheduler = AsyncIOScheduler()
+
+    @staticmethod
+    def _partition_day(name: str) -> date | None:
+        """
+        pYYYYMMDD → date. pmax (and anything unexpected) → None.
+        """
+        try:
+            return datetime.strptime(name, "p%Y%m%d").date()
+        except ValueError:
+            return None
+
+    async def run_once(self):
+        async with self.db_session_factory() as session:
+            result = await session.execute(text("""
+                SELECT PARTITION_NAME
+                FROM information_schema.PARTITIONS
+                WHERE TABLE_SCHEMA = DATABASE()
+                  AND TABLE_NAME = 'station_telemetry'
+                  AND PARTITION_NAME IS NOT NULL;
+            """))
+            names = result.scalars().all()
+
+            # Table not partitioned yet (migration pending)
+            if "pmax" not in names:
+                return
+
+            days = sorted(
+                day for day in map(self._partition_day, names) if day is not None
+            )
+            today = datetime.utcnow().date()
+
+            # Split new daily partitions off the (empty) catch-all
+            start = days[-1] + timedelta(days=1) if days else today
+            end = today + timedelta(days=settings.TELEMETRY_PARTITIONS_AHEAD)
+            new_partitions = []
+            day = start
+            while day <= end:
+                upper = (day + timedelta(days=1)).isoformat()
+                new_partitions.append(
+                    f"PARTITION p{day:%Y%m%d} VALUES LESS THAN (TO_DAYS('{upper}'))"
+                )
+                day += timedelta(days=1)
+
+            if new_partitions:
+                new_partitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+                await session.execute(text(
+                    "ALTER TABLE station_telemetry REORGANIZE PARTITION pmax INTO ("
+                    + ", ".join(new_partitions)
+                    + ");"
+                ))
+
+            # Drop whole days past retention
+            cutoff = today - timedelta(days=settings.TELEMETRY_RETENTION_DAYS)
+            expired = [f"p{day:%Y%m%d}" for day in days if day < cutoff]
+
+            if expired:
+                await session.execute(text(
+                    "ALTER TABLE station_telemetry DROP PARTITION "
+                    + ", ".join(expired)
+                    + ";"
+                ))
+
+    def start(self):
+        """
+        Hourly is plenty: partitions are created a week ahead.
+        """
+        self.scheduler.add_job(
+            self.run_once,
+            trigger="interval",
+            hours=1,
+            max_instances=1,
+            next_run_time=datetime.now(),
+        )
+        self.scheduler.start()
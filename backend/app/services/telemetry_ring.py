@@ -0,0 +1,311 @@
+import time
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import select, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..models.models import StationTelemetry
+
+
+def to_epoch(timestamps) -> np.ndarray:
+    """
+    Naive-UTC datetimes → float seconds since epoch.
+    """
+    return (
+        np.array(timestamps, dtype="datetime64[us]").astype(np.int64) / 1_000_000
+    )
+
+
+def from_epoch(seconds: np.ndarray) -> list[datetime]:
+    """
+    Float seconds since epoch → naive-UTC datetimes.
+    """
+    micros = np.round(np.asarray(seconds) * 1_000_000).astype(np.int64)
+    return micros.astype("datetime64[us]").tolist()
+
+
+class TelemetryRingStore:
+    """
+    Process-local ring buffers holding the last `capacity` readings
+    of every station.
+
+    All rings live in shared preallocated arrays (one row per station):
+    • values     → (stations, capacity, 3) voltage/current/temperature
+    • timestamps → (stations, capacity) epoch seconds
+    so a fleet-wide append or read is a handful of vectorized ops.
+
+    A ring is "warm" for `ttl` seconds after it was seeded from the DB.
+    In between, writes this process commits keep it current; the TTL
+    bounds how long writes committed by other workers stay invisible.
+    Only warm rings answer reads, anything else goes back to the DB.
+
+    Rows are appended after their INSERT committed, newest last. A
+    reading older than its station's newest one (backfill, clock skew)
+    resets that ring instead, so the next read reseeds from the DB.
+    """
+
+    def __init__(self, capacity: int, ttl: float, initial_stations: int = 1024):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._rows: dict[int, int] = {}
+        self._allocate(initial_stations)
+
+    def _allocate(self, size: int):
+        self._values = np.zeros((size, self.capacity, 3), dtype=np.float64)
+        self._timestamps = np.zeros((size, self.capacity), dtype=np.float64)
+        self._heads = np.zeros(size, dtype=np.int64)  # next write position
+        self._counts = np.zeros(size, dtype=np.int64)
+        self._warmed_at = np.full(size, -np.inf)  # time.monotonic() of last seed
+
+    def _grow(self, needed: int):
+        size = len(self._heads)
+        if needed <= size:
+            return
+
+        new_size = max(needed, size * 2)
+        values, timestamps = self._values, self._timestamps
+        heads, counts, warmed_at = self._heads, self._counts, self._warmed_at
+
+        self._allocate(new_size)
+        self._values[:size] = values
+        self._timestamps[:size] = timestamps
+        self._heads[:size] = heads
+        self._counts[:size] = counts
+        self._warmed_at[:size] = warmed_at
+
+    def _rows_for(self, station_ids) -> np.ndarray:
+        rows = self._rows
+        for station_id in station_ids:
+            if station_id not in rows:
+                rows[station_id] = len(rows)
+        self._grow(len(rows))
+        return np.fromiter(
+            (rows[station_id] for station_id in station_ids),
+            dtype=np.int64,
+            count=len(station_ids),
+        )
+
+    def _fresh(self, rows: np.ndarray) -> np.ndarray:
+        return time.monotonic() - self._warmed_at[rows] < self.ttl
+
+    def _gather(self, rows: np.ndarray, depth: int):
+        """
+        Newest-first (len(rows), depth) index grid plus validity mask.
+        """
+        offsets = np.arange(depth)
+        positions = (self._heads[rows, None] - 1 - offsets) % self.capacity
+        valid = offsets < np.minimum(self._counts[rows], depth)[:, None]
+        return positions, valid
+
+    # -------------------------
+    # WRITES
+    # -------------------------
+
+    def append_many(self, station_ids, values, timestamps):
+        """
+        Appends committed readings.
+        values: (n, 3) array-like, timestamps: epoch seconds (n,)
+        """
+        station_ids = list(station_ids)
+        if not station_ids:
+            return
+
+        rows = self._rows_for(station_ids)
+        values = np.asarray(values, dtype=np.float64).reshape(-1, 3)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+
+        # Readings older than the ring's newest cannot be appended in
+        # place: those rings are emptied and go cold instead
+        newest = np.where(
+            self._counts[rows] > 0,
+            self._timestamps[rows, (self._heads[rows] - 1) % self.capacity],
+            -np.inf,
+        )
+        late = timestamps < newest
+        if late.any():
+            reset = np.unique(rows[late])
+            self._heads[reset] = 0
+            self._counts[reset] = 0
+            self._warmed_at[reset] = -np.inf
+
+            keep = ~np.isin(rows, reset)
+            rows, values, timestamps = rows[keep], values[keep], timestamps[keep]
+            if not len(rows):
+                return
+
+        # Rank of each reading within its station in time order, so
+        # repeated station ids in one batch land in consecutive slots
+        order = np.lexsort((timestamps, rows))
+        sorted_rows = rows[order]
+        starts = np.r_[0, np.flatnonzero(np.diff(sorted_rows)) + 1]
+        group_sizes = np.diff(np.r_[starts, len(sorted_rows)])
+        ranks = np.empty(len(rows), dtype=np.int64)
+        ranks[order] = np.arange(len(rows)) - np.repeat(starts, group_sizes)
+
+        positions = (self._heads[rows] + ranks) % self.capacity
+        self._values[rows, positions] = values
+        self._timestamps[rows, positions] = timestamps
+
+        unique_rows = sorted_rows[starts]
+        self._heads[unique_rows] = (
+            self._heads[unique_rows] + group_sizes
+        ) % self.capacity
+        self._counts[unique_rows] = np.minimum(
+            self._counts[unique_rows] + group_sizes, self.capacity
+        )
+
+    def append_rows(self, rows: list[dict]):
+        """
+        Convenience wrapper for telemetry row dicts (as inserted).
+        """
+        if not rows:
+            return
+
+        self.append_many(
+            [row["station_id"] for row in rows],
+            [[row["voltage"], row["current"], row["temperature"]] for row in rows],
+            to_epoch([row["timestamp"] for row in rows]),
+        )
+
+    def seed(self, station_id: int, values, timestamps):
+        """
+        Marks a ring warm using DB rows (newest first).
+        The DB is authoritative; in-memory readings are kept only when
+        newer than every DB row (appended after the DB read).
+        """
+        row = self._rows_for([station_id])[0]
+
+        db_values = np.asarray(values, dtype=np.float64).reshape(-1, 3)
+        db_timestamps = np.asarray(timestamps, dtype=np.float64)
+
+        positions, valid = self._gather(np.array([row]), self.capacity)
+        positions = positions[0][valid[0]]
+        mem_values = self._values[row, positions]
+        mem_timestamps = self._timestamps[row, positions]
+
+        if len(db_timestamps):
+            newer = mem_timestamps > db_timestamps.max()
+            mem_values, mem_timestamps = mem_values[newer], mem_timestamps[newer]
+
+        merged_values = np.concatenate([mem_values, db_values])[: self.capacity]
+        merged_timestamps = np.concatenate([mem_timestamps, db_timestamps])[
+            : self.capacity
+        ]
+        count = len(merged_timestamps)
+
+        # Store oldest → newest so head points after the newest reading
+        self._values[row, :count] = merged_values[::-1]
+        self._timestamps[row, :count] = merged_timestamps[::-1]
+        self._heads[row] = count % self.capacity
+        self._counts[row] = count
+        self._warmed_at[row] = time.monotonic()
+
+    async def warm_up(self, session: AsyncSession, station_id: int):
+        """
+        Cold-start / expiry fallback: seeds one station's ring from the
+        DB. No-op while the ring is warm.
+        """
+        if self.is_warm(station_id):
+            return
+
+        rows = (
+            await session.execute(
+                select(
+                    StationTelemetry.voltage,
+                    StationTelemetry.current,
+                    StationTelemetry.temperature,
+                    StationTelemetry.timestamp,
+                )
+                .where(StationTelemetry.station_id == station_id)
+                .order_by(desc(StationTelemetry.timestamp))
+                .limit(self.capacity)
+            )
+        ).all()
+
+        # Unknown ids are not given a ring (keeps memory bounded); an
+        # existing ring is marked warm (and empty) so it can answer
+        if not rows and station_id not in self._rows:
+            return
+
+        self.seed(
+            station_id,
+            [row[:3] for row in rows],
+            to_epoch([row[3] for row in rows]),
+        )
+
+    # -------------------------
+    # READS
+    # -------------------------
+
+    def is_warm(self, station_id: int) -> bool:
+        row = self._rows.get(station_id)
+        return row is not None and bool(self._fresh(np.array([row]))[0])
+
+    def latest(self, station_id: int):
+        """
+        Returns (voltage, current, temperature, timestamp) or None.
+        None means "ask the DB" unless the ring is warm.
+        """
+        if not self.is_warm(station_id):
+            return None
+
+        row = self._rows[station_id]
+        if self._counts[row] == 0:
+            return None
+
+        position = (self._heads[row] - 1) % self.capacity
+        voltage, current, temperature = self._values[row, position].tolist()
+        return voltage, current, temperature, from_epoch(
+            self._timestamps[row, position]
+        )
+
+    def window(self, station_id: int, depth: int):
+        """
+        Last `depth` readings newest-first as (values, timestamps),
+        or None when the ring cannot answer authoritatively.
+        """
+        if not self.is_warm(station_id):
+            return None
+
+        row = self._rows[station_id]
+
+        positions, valid = self._gather(np.array([row]), depth)
+        positions = positions[0][valid[0]]
+        return self._values[row, positions], self._timestamps[row, positions]
+
+    def windows(self, station_ids, depth: int):
+        """
+        Fleet-wide window read.
+        Returns (owners, values, missing):
+        • owners → station id of every returned reading
+        • values → (n, 3) readings of all servable stations
+        • missing → station ids that need a DB read
+        """
+        served, missing = [], []
+        now = time.monotonic()
+        for station_id in station_ids:
+            row = self._rows.get(station_id)
+            if row is not None and now - self._warmed_at[row] < self.ttl:
+                served.append((station_id, row))
+            else:
+                missing.append(station_id)
+
+        if not served:
+            return np.empty(0, dtype=np.int64), np.empty((0, 3)), missing
+
+        ids = np.array([station_id for station_id, _ in served], dtype=np.int64)
+        rows = np.array([row for _, row in served], dtype=np.int64)
+
+        positions, valid = self._gather(rows, depth)
+        owners = np.broadcast_to(ids[:, None], positions.shape)[valid]
+        values = self._values[rows[:, None], positions][valid]
+
+        return owners, values, missing
+
+
+telemetry_ring = TelemetryRingStore(
+    settings.TELEMETRY_RING_SIZE,
+    ttl=settings.TELEMETRY_RING_TTL_SECONDS,
+)
@@ -0,0 +1,390 @@
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import DateTime, cast, select, func, case, literal
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..models.models import (
+    Station,
+    StationTelemetry,
+    StationTelemetryMinute,
+    StationTelemetryHour,
+    TelemetryRollupState,
+)
+
+MINUTE_FORMAT = "%Y-%m-%d %H:%i:00"
+HOUR_FORMAT = "%Y-%m-%d %H:00:00"
+
+# Windows shorter than this are cheap enough to scan raw
+RAW_WINDOW = timedelta(minutes=5)
+
+FAULT_TEMPERATURE = 80
+
+
+def _floor(dt: datetime, unit: timedelta) -> datetime:
+    if unit == timedelta(hours=1):
+        return dt.replace(minute=0, second=0, microsecond=0)
+    return dt.replace(second=0, microsecond=0)
+
+
+def _ceil(dt: datetime, unit: timedelta) -> datetime:
+    floored = _floor(dt, unit)
+    return floored if floored == dt else floored + unit
+
+
+class TelemetryRollupService:
+    def __init__(self, db_session_factory):
+        """
+        db_session_factory: callable returning AsyncSession
+        Incrementally folds new station_telemetry rows into the
+        1-minute rollup, then recomputes the touched 1-hour buckets.
+        """
+        self.db_session_factory = db_session_factory
+        self.scheduler = AsyncIOScheduler()
+        # (monotonic, utcnow, max id) seen at each tick, oldest first
+        self._samples: deque[tuple[float, datetime, int]] = deque()
+
+    def _safe_sample(self, max_id: int):
+        """
+        Records this tick's max(id) and returns the newest sample that
+        is at least TELEMETRY_ROLLUP_COMMIT_LAG_SECONDS old, or None.
+
+        Ids are allocated at INSERT but become visible at COMMIT, so a
+        long flush transaction can commit ids below the current max(id).
+        Every transaction open when the sample was taken has committed
+        by the time the sample is old enough, so all ids up to its
+        max(id) are final.
+        """
+        now = time.monotonic()
+        self._samples.append((now, datetime.utcnow(), max_id))
+
+        cutoff = now - settings.TELEMETRY_ROLLUP_COMMIT_LAG_SECONDS
+        safe = None
+        while self._samples and self._samples[0][0] <= cutoff:
+            safe = self._samples.popleft()
+
+        # Keep the chosen sample: it stays the best one until a newer
+        # sample ages past the cutoff
+        if safe is not None:
+            self._samples.appendleft(safe)
+        return safe
+
+    async def _minute_rollup(self, session: AsyncSession, low_id: int, high_id: int):
+        raw = StationTelemetry
+        bucket = func.date_format(raw.timestamp, MINUTE_FORMAT)
+
+        source = (
+            select(
+                raw.station_id,
+                bucket,
+                func.count(),
+                func.min(raw.voltage),
+                func.max(raw.voltage),
+                func.avg(raw.voltage),
+                func.min(raw.current),
+                func.max(raw.current),
+                func.avg(raw.current),
+                func.min(raw.temperature),
+                func.max(raw.temperature),
+                func.avg(raw.temperature),
+                func.sum(case((raw.temperature > FAULT_TEMPERATURE, 1), else_=0)),
+            )
+            # Raw telemetry has no FK (partitioned), rollups do: rows
+            # of deleted stations are skipped instead of failing the insert
+            .join(Station, Station.id == raw.station_id)
+            .where(raw.id > low_id, raw.id <= high_id)
+            .group_by(raw.station_id, bucket)
+        )
+
+        table = StationTelemetryMinute.__table__
+        stmt = mysql_insert(table).from_select(
+            [
+                "station_id",
+                "bucket_start",
+                "sample_count",
+                "voltage_min",
+                "voltage_max",
+                "voltage_avg",
+                "current_min",
+                "current_max",
+                "current_avg",
+                "temperature_min",
+                "temperature_max",
+                "temperature_avg",
+                "fault_count",
+            ],
+            source,
+        )
+        new = stmt.inserted
+        c = table.c
+        total = c.sample_count + new.sample_count
+
+        def merged_avg(name):
+            return (
+                c[name] * c.sample_count + new[name] * new.sample_count
+            ) / total
+
+        # MySQL applies assignments left to right: averages must be
+        # merged while sample_count still holds the old value
+        stmt = stmt.on_duplicate_key_update(
+            [
+                ("voltage_avg", merged_avg("voltage_avg")),
+                ("current_avg", merged_avg("current_avg")),
+                ("temperature_avg", merged_avg("temperature_avg")),
+                ("voltage_min", func.least(c.voltage_min, new.voltage_min)),
+                ("voltage_max", func.greatest(c.voltage_max, new.voltage_max)),
+                ("current_min", func.least(c.current_min, new.current_min)),
+                ("current_max", func.greatest(c.current_max, new.current_max)),
+                ("temperature_min", func.least(c.temperature_min, new.temperature_min)),
+                ("temperature_max", func.greatest(c.temperature_max, new.temperature_max)),
+                ("fault_count", c.fault_count + new.fault_count),
+                ("sample_count", total),
+            ]
+        )
+
+        await session.execute(stmt)
+
+    async def _hour_rollup(self, session: AsyncSession, since: datetime, until: datetime):
+        """
+        Rebuilds every hour bucket in [since, until) from minute rows.
+        Idempotent: hour rows are overwritten, not incremented.
+        """
+        minute = StationTelemetryMinute
+        bucket = func.date_format(minute.bucket_start, HOUR_FORMAT)
+        samples = func.sum(minute.sample_count)
+
+        def weighted(column):
+            return func.sum(column * minute.sample_count) / samples
+
+        source = (
+            select(
+                minute.station_id,
+                bucket,
+                samples,
+                func.min(minute.voltage_min),
+                func.max(minute.voltage_max),
+                weighted(minute.voltage_avg),
+                func.min(minute.current_min),
+                func.max(minute.current_max),
+                weighted(minute.current_avg),
+                func.min(minute.temperature_min),
+                func.max(minute.temperature_max),
+                weighted(minute.temperature_avg),
+                func.sum(minute.fault_count),
+            )
+            .where(minute.bucket_start >= since, minute.bucket_start < until)
+            .group_by(minute.station_id, bucket)
+        )
+
+        columns = [
+            "station_id",
+            "bucket_start",
+            "sample_count",
+            "voltage_min",
+            "voltage_max",
+            "voltage_avg",
+            "current_min",
+            "current_max",
+            "current_avg",
+            "temperature_min",
+            "temperature_max",
+            "temperature_avg",
+            "fault_count",
+        ]
+        stmt = mysql_insert(StationTelemetryHour.__table__).from_select(columns, source)
+        stmt = stmt.on_duplicate_key_update(
+            {name: stmt.inserted[name] for name in columns[2:]}
+        )
+
+        await session.execute(stmt)
+
+    async def _run_batch(self, safe_id: int, safe_time: datetime) -> bool:
+        """
+        One bounded increment:
+        (watermark, min(safe_id, watermark + TELEMETRY_ROLLUP_BATCH_ROWS)].
+        Rollup rows, the new watermark and its coverage commit together.
+        Returns True once the watermark has reached safe_id.
+        """
+        async with self.db_session_factory() as session:
+            try:
+                # Every worker runs this job: the row lock makes each
+                # id range fold into the (merging) minute upsert once
+                await session.execute(
+                    mysql_insert(TelemetryRollupState)
+                    .values(name="1m", last_id=0)
+                    .prefix_with("IGNORE")
+                )
+                state = (
+                    await session.execute(
+                        select(TelemetryRollupState)
+                        .where(TelemetryRollupState.name == "1m")
+                        .with_for_update()
+                    )
+                ).scalar_one()
+
+                low_id = state.last_id
+                high_id = min(safe_id, low_id + settings.TELEMETRY_ROLLUP_BATCH_ROWS)
+
+                if high_id > low_id:
+                    first, last = (
+                        await session.execute(
+                            select(
+                                func.min(StationTelemetry.timestamp),
+                                func.max(StationTelemetry.timestamp),
+                            ).where(
+                                StationTelemetry.id > low_id,
+                                StationTelemetry.id <= high_id,
+                            )
+                        )
+                    ).one()
+
+                    if first is not None:
+                        await self._minute_rollup(session, low_id, high_id)
+                        await self._hour_rollup(
+                            session,
+                            _floor(first, timedelta(hours=1)),
+                            _floor(last, timedelta(hours=1)) + timedelta(hours=1),
+                        )
+
+                    state.last_id = high_id
+
+                caught_up = high_id >= safe_id
+                if caught_up:
+                    # Rows past the watermark are either already visible
+                    # (committed after the sample) or were written after
+                    # safe_time; coverage stops at the oldest of them
+                    pending = (
+                        await session.execute(
+                            select(func.min(StationTelemetry.timestamp)).where(
+                                StationTelemetry.id > high_id
+                            )
+                        )
+                    ).scalar()
+                    covered = safe_time if pending is None else min(pending, safe_time)
+                    state.covered_until = _floor(covered, timedelta(minutes=1))
+
+                await session.commit()
+                return caught_up
+
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def run_once(self):
+        """
+        Rolls up to the commit-safe watermark in at most
+        TELEMETRY_ROLLUP_MAX_BATCHES committed batches.
+        """
+        async with self.db_session_factory() as session:
+            max_id = (
+                await session.execute(select(func.max(StationTelemetry.id)))
+            ).scalar()
+
+        safe = self._safe_sample(max_id or 0)
+        if safe is None:
+            return
+
+        _, safe_time, safe_id = safe
+        for _ in range(settings.TELEMETRY_ROLLUP_MAX_BATCHES):
+            if await self._run_batch(safe_id, safe_time):
+                return
+
+    def start(self):
+        self.scheduler.add_job(
+            self.run_once,
+            trigger="interval",
+            seconds=settings.TELEMETRY_ROLLUP_INTERVAL_SECONDS,
+            max_instances=1,
+        )
+        self.scheduler.start()
+
+
+async def count_faults(
+    session: AsyncSession,
+    station_id: int,
+    since: datetime,
+    until: datetime,
+) -> int:
+    """
+    Fault events (temperature > 80) for one station in [since, until).
+
+    Long windows are answered from rollups, tiered as
+        raw | 1m | 1h ... 1h | 1m | raw
+    with raw rows only at the ragged edges and past the rollup
+    state's covered_until (everything the job has not reached yet).
+    All tiers are summed in a single statement.
+    """
+    raw = StationTelemetry
+    state = TelemetryRollupState
+    minute, hour = timedelta(minutes=1), timedelta(hours=1)
+
+    head = _ceil(since, minute)
+    first_hour = _ceil(head, hour)
+
+    # Bounds as SQL over the rollup state row. Every tier LEFT JOINs
+    # that row by primary key, so MySQL reads it as a constant table
+    # and still range-scans; no separate round trip. A missing state
+    # collapses the rollup tiers to empty ranges (all raw)
+    tail = cast(
+        func.greatest(
+            literal(head),
+            func.least(
+                literal(_floor(until, minute)),
+                func.coalesce(state.covered_until, literal(head)),
+            ),
+        ),
+        DateTime,
+    )
+    last_hour = func.greatest(
+        literal(first_hour),
+        cast(func.date_format(tail, HOUR_FORMAT), DateTime),
+    )
+
+    def with_state(stmt):
+        return stmt.outerjoin(state, state.name == "1m")
+
+    def raw_count(start, end):
+        return (
+            with_state(select(func.count(raw.id)).select_from(raw))
+            .where(
+                raw.station_id == station_id,
+                raw.timestamp >= start,
+                raw.timestamp < end,
+                raw.temperature > FAULT_TEMPERATURE,
+            )
+            .scalar_subquery()
+        )
+
+    def rollup_count(model, start, end):
+        return (
+            with_state(
+                select(func.coalesce(func.sum(model.fault_count), 0)).select_from(model)
+            )
+            .where(
+                model.station_id == station_id,
+                model.bucket_start >= start,
+                model.bucket_start < end,
+            )
+            .scalar_subquery()
+        )
+
+    if until - since < RAW_WINDOW:
+        parts = [raw_count(since, until)]
+    else:
+        parts = [
+            raw_count(since, head),
+            rollup_count(StationTelemetryMinute, head, func.least(literal(first_hour), tail)),
+            rollup_count(StationTelemetryHour, first_hour, last_hour),
+            rollup_count(StationTelemetryMinute, last_hour, tail),
+            raw_count(tail, until),
+        ]
+
+    total = literal(0)
+    for part in parts:
+        total = total + part
+
+    return int((await session.execute(select(total))).scalar() or 0)
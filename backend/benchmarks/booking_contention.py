@@ -0,0 +1,164 @@
+"""
+Booking write-path contention benchmark.
+
+Runs the same randomized workload against the legacy write path
+(overlap SELECT → station SELECT → version CAS → INSERT → COMMIT → refresh)
+and the conditional INSERT … SELECT path, then reports throughput,
+409 rate and the no-double-booking invariant for each.
+
+Needs a migrated database (settings from .env) plus an existing user and
+stations. Bookings are written far in the future and removed afterwards.
+
+    cd backend
+    python -m benchmarks.booking_contention --user-id 1 --station-ids 1 2 \\
+        --workers 64 --attempts 2000 --slots 48
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, delete, select, update
+
+from app.db.session import AsyncSessionLocal, engine
+from app.models.models import Booking, BookingStatus, Station
+from app.services.booking_writes import insert_booking
+
+from .common import BASE_TIME, count_overlaps
+
+
+async def legacy_insert(session, user_id, station_id, start_time, end_time):
+    """
+    The pre-redesign create_booking path, kept for comparison.
+    """
+    overlap = await session.execute(
+        select(Booking).where(
+            and_(
+                Booking.station_id == station_id,
+                Booking.status == BookingStatus.confirmed,
+                Booking.start_time < end_time,
+                Booking.end_time > start_time,
+            )
+        )
+    )
+    if overlap.scalars().first():
+        return None
+
+    station = (
+        await session.execute(select(Station).where(Station.id == station_id))
+    ).scalar_one_or_none()
+    if station is None:
+        return None
+
+    cas = await session.execute(
+        update(Station)
+        .where(Station.id == station_id, Station.version == station.version)
+        .values(version=Station.version + 1)
+    )
+    if cas.rowcount == 0:
+        await session.rollback()
+        return None
+
+    booking = Booking(
+        user_id=user_id,
+        station_id=station_id,
+        start_time=start_time,
+        end_time=end_time,
+        total_cost=round(
+            (end_time - start_time).total_seconds() / 3600 * station.price_per_hour, 2
+        ),
+        status=BookingStatus.confirmed,
+        version=1,
+    )
+    session.add(booking)
+    await session.commit()
+    await session.refresh(booking)
+    return booking.id
+
+
+def build_workload(args) -> list[tuple[int, datetime, datetime]]:
+    """
+    Hour-aligned 1–3 hour windows; fewer --slots means more overlap.
+    """
+    rng = random.Random(args.seed)
+    workload = []
+    for _ in range(args.attempts):
+        station_id = rng.choice(args.station_ids)
+        start = BASE_TIME + timedelta(hours=rng.randrange(args.slots))
+        workload.append((station_id, start, start + timedelta(hours=rng.randint(1, 3))))
+    return workload
+
+
+async def run(path, args, workload) -> dict:
+    queue = asyncio.Queue()
+    for item in workload:
+        queue.put_nowait(item)
+
+    stats = {"created": 0, "conflicts": 0, "errors": 0}
+
+    async def worker():
+        while True:
+            try:
+                station_id, start, end = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            async with AsyncSessionLocal() as session:
+                try:
+                    booking_id = await path(
+                        session, args.user_id, station_id, start, end
+                    )
+                except Exception:
+                    stats["errors"] += 1
+                    continue
+            stats["created" if booking_id else "conflicts"] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.workers)))
+    stats["seconds"] = time.perf_counter() - started
+    stats["double_booked"] = await count_overlaps(args.station_ids)
+    return stats
+
+
+async def cleanup(station_ids):
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            delete(Booking).where(
+                Booking.station_id.in_(station_ids),
+                Booking.start_time >= BASE_TIME,
+            )
+        )
+        await session.commit()
+
+
+def report(name, stats, attempts):
+    print(
+        f"{name:<12} {attempts / stats['seconds']:>9.1f} req/s  "
+        f"created={stats['created']:<6} "
+        f"409={stats['conflicts'] / attempts:>6.1%}  "
+        f"errors={stats['errors']:<4} "
+        f"double_booked={stats['double_booked']}"
+    )
+
+
+async def main(args):
+    workload = build_workload(args)
+    try:
+        for name, path in (("legacy", legacy_insert), ("conditional", insert_booking)):
+            await cleanup(args.station_ids)
+            report(name, await run(path, args, workload), len(workload))
+    finally:
+        await cleanup(args.station_ids)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--station-ids", type=int, nargs="+", required=True)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--attempts", type=int, default=2000)
+    parser.add_argument("--slots", type=int, default=48)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,230 @@
+"""
+HTTP load test for POST /api/v1/bookings/ under contention.
+
+Drives N concurrent async clients at the FastAPI app in-process
+(httpx ASGI transport, no lifespan → no simulator / background jobs)
+against the MySQL configured in .env. The row-locking behaviour being
+measured is InnoDB's, so there is no SQLite stand-in.
+
+Seeds throwaway drivers and hot/cold stations, fires a configurable mix
+of overlapping and disjoint windows, then reports throughput, latency
+percentiles, conflict rate and double-booking violations. Seeded rows
+(and their bookings, via ON DELETE CASCADE) are removed at the end.
+
+    cd backend
+    python -m benchmarks.booking_load --clients 64 --requests 5000 \\
+        --hot-stations 2 --cold-stations 50 --hot-share 0.8 --overlap-share 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from datetime import timedelta
+
+import httpx
+from sqlalchemy import delete, func, insert, select
+
+from app.core.security import create_access_token, hash_password
+from app.db.session import AsyncSessionLocal, engine
+from app.main import app
+from app.models.models import Station, StationStatus, User, UserRole
+
+from .common import BASE_TIME, count_overlaps, percentiles
+
+EMAIL_DOMAIN = "loadtest.invalid"
+STATION_PREFIX = "loadtest-"
+
+# Overlapping requests compete for this many hour slots per station
+CONTESTED_SLOTS = 4
+
+
+async def seed(args) -> tuple[list[str], list[int], list[int]]:
+    """
+    Returns (driver tokens, hot station ids, cold station ids).
+    """
+    password = hash_password("loadtest")
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            insert(User),
+            [
+                {
+                    "email": f"{role.value}-{i}@{EMAIL_DOMAIN}",
+                    "hashed_password": password,
+                    "role": role,
+                    "is_active": True,
+                }
+                for role, count in (
+                    (UserRole.station_owner, 1),
+                    (UserRole.driver, args.drivers),
+                )
+                for i in range(count)
+            ],
+        )
+
+        users = (
+            await session.execute(
+                select(User.id, User.role).where(User.email.like(f"%@{EMAIL_DOMAIN}"))
+            )
+        ).all()
+        owner_id = next(u.id for u in users if u.role == UserRole.station_owner)
+        driver_ids = [u.id for u in users if u.role == UserRole.driver]
+
+        station_count = args.hot_stations + args.cold_stations
+        rng = random.Random(args.seed)
+        for i in range(station_count):
+            lat, lng = rng.uniform(-60, 60), rng.uniform(-180, 180)
+            await session.execute(
+                insert(Station).values(
+                    owner_id=owner_id,
+                    name=f"{STATION_PREFIX}{'hot' if i < args.hot_stations else 'cold'}-{i}",
+                    location_lat=lat,
+                    location_lng=lng,
+                    location=func.ST_SRID(func.POINT(lng, lat), 4326),
+                    price_per_hour=10.0,
+                    status=StationStatus.active,
+                    version=1,
+                )
+            )
+
+        station_ids = (
+            await session.execute(
+                select(Station.id)
+                .where(Station.name.like(f"{STATION_PREFIX}%"))
+                .order_by(Station.id)
+            )
+        ).scalars().all()
+        await session.commit()
+
+    tokens = [create_access_token(str(user_id)) for user_id in driver_ids]
+    return tokens, station_ids[: args.hot_stations], station_ids[args.hot_stations :]
+
+
+async def cleanup():
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            delete(Station).where(Station.name.like(f"{STATION_PREFIX}%"))
+        )
+        await session.execute(delete(User).where(User.email.like(f"%@{EMAIL_DOMAIN}")))
+        await session.commit()
+
+
+def build_workload(args, hot, cold) -> list[tuple[bool, dict]]:
+    """
+    (overlapping?, request body) pairs.
+
+    • Overlapping: one of CONTESTED_SLOTS hour slots → real contention
+    • Disjoint: a fresh hour per station → must always succeed
+    """
+    rng = random.Random(args.seed)
+    next_free = Counter()
+    workload = []
+
+    for _ in range(args.requests):
+        station_id = rng.choice(hot if rng.random() < args.hot_share or not cold else cold)
+        overlapping = rng.random() < args.overlap_share
+
+        if overlapping:
+            start = BASE_TIME + timedelta(hours=rng.randrange(CONTESTED_SLOTS))
+        else:
+            start = BASE_TIME + timedelta(hours=CONTESTED_SLOTS + next_free[station_id])
+            next_free[station_id] += 1
+
+        workload.append(
+            (
+                overlapping,
+                {
+                    "station_id": station_id,
+                    "start_time": start.isoformat(),
+                    "end_time": (start + timedelta(hours=1)).isoformat(),
+                },
+            )
+        )
+
+    return workload
+
+
+async def drive(args, tokens, workload) -> tuple[list[tuple[bool, int, float]], float]:
+    queue = asyncio.Queue()
+    for item in workload:
+        queue.put_nowait(item)
+
+    results = []
+
+    async def client(http: httpx.AsyncClient, rng: random.Random):
+        while True:
+            try:
+                overlapping, body = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            token = rng.choice(tokens)
+            started = time.perf_counter()
+            try:
+                response = await http.post(
+                    "/api/v1/bookings/",
+                    json=body,
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+                code = response.status_code
+            except Exception:
+                code = 0
+            results.append((overlapping, code, time.perf_counter() - started))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as http:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(client(http, random.Random(args.seed + i)) for i in range(args.clients))
+        )
+        elapsed = time.perf_counter() - started
+
+    return results, elapsed
+
+
+def report(results, elapsed, violations):
+    total = len(results)
+    codes = Counter(code for _, code, _ in results)
+    latency = percentiles([seconds * 1000 for _, _, seconds in results])
+    disjoint_conflicts = sum(
+        1 for overlapping, code, _ in results if not overlapping and code == 409
+    )
+
+    print(f"requests        {total}")
+    print(f"throughput      {total / elapsed:.1f} req/s")
+    print(
+        "latency ms      "
+        f"p50={latency[50]:.1f} p95={latency[95]:.1f} p99={latency[99]:.1f}"
+    )
+    print(f"status codes    {dict(sorted(codes.items()))}")
+    print(f"conflict rate   {codes[409] / total:.1%}")
+    print(f"disjoint 409s   {disjoint_conflicts}  (expected 0)")
+    print(f"contention 503s {codes[503]}  (lock retries exhausted)")
+    print(f"double bookings {violations}  (must be 0)")
+
+
+async def main(args):
+    await cleanup()
+    try:
+        tokens, hot, cold = await seed(args)
+        workload = build_workload(args, hot, cold)
+        results, elapsed = await drive(args, tokens, workload)
+        report(results, elapsed, await count_overlaps(hot + cold))
+    finally:
+        await cleanup()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--drivers", type=int, default=200)
+    parser.add_argument("--hot-stations", type=int, default=2)
+    parser.add_argument("--cold-stations", type=int, default=50)
+    parser.add_argument("--hot-share", type=float, default=0.8)
+    parser.add_argument("--overlap-share", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main(parser.parse_args()))
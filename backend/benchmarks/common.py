@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import aliased
+
+from app.db.session import AsyncSessionLocal
+from app.models.models import Booking, BookingStatus
+
+# Benchmarks book far in the future so they never collide with real data
+BASE_TIME = datetime(2100, 1, 1)
+
+
+def percentiles(samples, points=(50, 95, 99)) -> dict[int, float]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {p: 0.0 for p in points}
+    return {
+        p: ordered[min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))]
+        for p in points
+    }
+
+
+async def count_overlaps(station_ids) -> int:
+    """
+    Double-booking invariant: pairs of overlapping confirmed bookings.
+    Must always be 0.
+    """
+    other = aliased(Booking)
+    async with AsyncSessionLocal() as session:
+        return (
+            await session.execute(
+                select(func.count())
+                .select_from(Booking)
+                .join(
+                    other,
+                    and_(
+                        other.station_id == Booking.station_id,
+                        other.id > Booking.id,
+                        other.start_time < Booking.end_time,
+                        other.end_time > Booking.start_time,
+                    ),
+                )
+                .where(
+                    Booking.station_id.in_(station_ids),
+                    Booking.status == BookingStatus.confirmed,
+                    other.status == BookingStatus.confirmed,
+                    Booking.start_time >= BASE_TIME,
+                )
+            )
+        ).scalar_one()
@@ -0,0 +1,72 @@
+"""
+Plan check for the driver map's spatial prefilter.
+
+EXPLAINs the near() station query for a few centres and radii and
+fails unless MySQL reads `stations` through idx_stations_location
+(the R-tree on stations.location). A full scan here means the
+MBRContains predicate stopped being index-friendly, e.g. after a
+change to the envelope SRID or axis order.
+
+Needs a migrated database (settings from .env) with a realistic number
+of stations; on a near-empty table the optimizer may legitimately
+prefer a scan.
+
+    cd backend
+    python -m benchmarks.explain_near --lat 52.52 --lng 13.40 --radius-km 1 5 25
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import mysql
+
+from app.db.session import AsyncSessionLocal, engine
+from app.models.models import Station
+from app.services.geo import near
+
+EXPECTED_KEY = "idx_stations_location"
+
+
+def explain_sql(lat: float, lng: float, radius_km: float) -> str:
+    stmt = select(Station.id).where(near(lat, lng, radius_km))
+    compiled = stmt.compile(
+        dialect=mysql.dialect(),
+        compile_kwargs={"literal_binds": True},
+    )
+    return f"EXPLAIN {compiled}"
+
+
+async def main(args) -> int:
+    failures = 0
+    try:
+        async with AsyncSessionLocal() as session:
+            for radius_km in args.radius_km:
+                plan = (
+                    await session.execute(text(explain_sql(args.lat, args.lng, radius_km)))
+                ).mappings().all()
+
+                row = next(row for row in plan if row["table"] == "stations")
+                ok = row["key"] == EXPECTED_KEY
+                failures += not ok
+
+                print(
+                    f"radius={radius_km:<8g} "
+                    f"type={row['type']:<6} "
+                    f"key={row['key']} "
+                    f"rows={row['rows']} "
+                    f"{'OK' if ok else f'FAIL (expected {EXPECTED_KEY})'}"
+                )
+    finally:
+        await engine.dispose()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lat", type=float, default=52.52)
+    parser.add_argument("--lng", type=float, default=13.40)
+    parser.add_argument("--radius-km", type=float, nargs="+", default=[1.0, 5.0, 25.0])
+    sys.exit(asyncio.run(main(parser.parse_args())))